@@ -4,11 +4,38 @@ from .version import __version__, __author__
 
 from .fetchers import (
     JIRAFetcher,
-    convert_jira_issue
+    ReplayFetcher,
+    convert_jira_issue,
+    convert_jira_json,
+)
+
+from .async_fetchers import (
+    AsyncJIRAFetcher,
+)
+
+from .stats import (
+    FetchStats,
+    PageStats,
+)
+
+from .stores import (
+    ShelveTicketStore,
+    TicketStore,
+)
+
+from .snapshots import (
+    dump_tickets,
+    load_tickets,
+)
+
+from .caches import (
+    AnalysisCache,
 )
 
 from .analyzers import (
+    BatchDateAnalyzer,
     DateAnalyzer,
+    MultiContextAnalyzer,
     PartialDateAnalyzer,
 )
 
@@ -35,8 +62,14 @@ __all__ = [
     "__version__",
     "__author__",
     "JIRAFetcher",
+    "AsyncJIRAFetcher",
+    "ReplayFetcher",
     "convert_jira_issue",
+    "convert_jira_json",
     "DateAnalyzer",
+    "BatchDateAnalyzer",
+    "MultiContextAnalyzer",
+    "AnalysisCache",
     "ThroughputReporter",
     "LeadTimeDistributionReporter",
     "TicketReporter",
@@ -46,5 +79,11 @@ __all__ = [
     "SLAReporter",
     "PartialDateAnalyzer",
     "CreatedReporter",
-    "CycleTimePercentileReporter"
+    "CycleTimePercentileReporter",
+    "ShelveTicketStore",
+    "TicketStore",
+    "FetchStats",
+    "PageStats",
+    "dump_tickets",
+    "load_tickets",
 ]
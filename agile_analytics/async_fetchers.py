@@ -0,0 +1,290 @@
+"""Fetch data from agile sources on an asyncio event loop."""
+
+import asyncio
+from base64 import b64encode
+from collections import deque
+
+import aiohttp
+
+from .fetchers import (
+    BaseJIRAFetcher,
+    _is_newer,
+    _missing_changelog_offsets,
+    _splice_changelog,
+    convert_jira_json,
+    merge_tickets,
+    parse_jira_datetime,
+)
+
+
+class AsyncJIRAFetcher(BaseJIRAFetcher):
+    """Fetch data from JIRA's REST API with aiohttp and transform it into AgileTickets.
+
+    Produces the same AgileTickets as JIRAFetcher(raw=True), but every search
+    request is a coroutine, so one event loop can drive many filters at once.
+    Throttled requests are retried by the rate controller, just as
+    JIRAFetcher retries them.
+
+    Attributes:
+        session_kwargs (dict): Additional kwargs passed to aiohttp.ClientSession when the fetcher creates one.
+    """
+
+    API_PATH = "/rest/api/2/"
+
+    def __init__(self, url, auth, filter_id, max_results=None, page_size=100, concurrency=10, fields=None, semaphore=None, session_kwargs=None, rate_controller=None):
+        """Create AsyncJIRAFetcher.
+
+        Args:
+            url (str): Fully qualified URL include http/https scheme to your JIRA instance
+            auth (dict): Dictionary with username/password keys for basic auth
+            filter_id (int|str|list): The JIRA filter ID of results you wish to fetch, a raw JQL
+                string, or a list of either whose results are fetched together without duplicates
+            max_results (Optional[int]): Maximum number of results to fetch, defaults to all of them
+            page_size (Optional[int]): Number of results requested per search call, defaults to 100
+            concurrency (Optional[int]): Number of requests allowed in flight at once, defaults to 10
+            fields (Optional[list]): Extra issue fields to request on top of DEFAULT_FIELDS
+            semaphore (Optional[asyncio.Semaphore]): Limits requests in flight, share one between
+                fetchers to cap the total across filters. Defaults to one sized by concurrency.
+            session_kwargs (Optional[dict]): Additional kwargs passed to aiohttp.ClientSession
+            rate_controller (Optional[RateController]): Retries throttled requests with backoff,
+                defaults to one retrying up to 5 times
+
+        Returns:
+            AsyncJIRAFetcher: instance
+
+        Raises:
+            TypeError: When username/password keys were not provided in the auth dict
+        """
+        super().__init__(
+            url, auth, filter_id,
+            max_results=max_results, page_size=page_size, concurrency=concurrency, fields=fields, rate_controller=rate_controller,
+        )
+        if 'basic_auth' not in self.auth_kwargs:
+            raise TypeError("AsyncJIRAFetcher only supports %s in the auth parameter" % (self.BASIC_AUTH_KEYS, ))
+        self.session_kwargs = session_kwargs or {}
+        self._semaphore = semaphore
+        credentials = "{}:{}".format(*self.auth_kwargs['basic_auth']).encode('utf-8')
+        self._headers = {'Authorization': "Basic " + b64encode(credentials).decode('ascii')}
+
+    @property
+    def semaphore(self):
+        """asyncio.Semaphore: Limits the number of requests in flight."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def fetch(self, session=None, since=None):
+        """Fetch data and return AgileTickets.
+
+        Args:
+            session (Optional[aiohttp.ClientSession]): Session to make requests with, one is created
+                (and closed) for this fetch when not provided
+            since (Optional[datetime]): Only fetch tickets updated at or after this time
+
+        Returns:
+            list: List of AgileTicket instances or empty list
+
+        Raises:
+            aiohttp.ClientResponseError: When JIRA responds with an error, or is still throttling after every retry
+        """
+        tickets = []
+        async with self.stream(session=session, since=since) as stream:
+            async for ticket in stream:
+                tickets.append(ticket)
+        return merge_tickets(tickets)
+
+    async def fetch_incremental(self, store, session=None):
+        """Fetch only the tickets updated since the store's watermark and merge them into it.
+
+        Args:
+            store (BaseTicketStore): Where previously fetched tickets are kept
+            session (Optional[aiohttp.ClientSession]): Session to make requests with
+
+        Returns:
+            list: List of the changed AgileTicket instances or empty list
+        """
+        tickets = await self.fetch(session=session, since=store.watermark)
+        store.merge(tickets)
+        return tickets
+
+    def stream(self, session=None, since=None):
+        """Return an async iterator of AgileTickets, in filter order, as their pages arrive.
+
+        Args:
+            session (Optional[aiohttp.ClientSession]): Session to make requests with
+            since (Optional[datetime]): Only fetch tickets updated at or after this time
+
+        Returns:
+            TicketStream
+        """
+        return TicketStream(self, since=since, session=session)
+
+    def make_session(self):
+        """Create the aiohttp.ClientSession used when a fetch isn't given one."""
+        return aiohttp.ClientSession(**self.session_kwargs)
+
+    async def _fetch_matches(self, session, since=None):
+        """Return a dict of issue key to the filters matching it, or None with only one filter."""
+        if len(self._queries) == 1:
+            return None
+        search_strings = [self._search_string(since, queries=[(where, None)]) for where, _ in self._queries]
+        results = await asyncio.gather(*[self._fetch_keys(session, s) for s in search_strings])
+        matches = {}
+        for label, keys in zip(self.filters, results):
+            for key in keys:
+                matches.setdefault(key, []).append(label)
+        return matches
+
+    async def _fetch_keys(self, session, search_string):
+        """Return the keys of every issue matching search_string, skipping fields and changelogs."""
+        keys = []
+        start_at = 0
+        while True:
+            issues, total = await self._fetch_page(session, search_string, start_at, self.KEY_PAGE_SIZE, fields=['key'], expand=None)
+            keys.extend(i['key'] for i in issues)
+            start_at += len(issues)
+            if not issues or start_at >= total:
+                return keys
+
+    async def _fetch_page(self, session, search_string, start_at, page_size, fields=None, expand="changelog"):
+        """Return a page of issue JSON and the total number of matches."""
+        params = dict(
+            jql=search_string,
+            startAt=start_at,
+            maxResults=page_size,
+            fields=",".join(self.fields if fields is None else fields),
+        )
+        if expand:
+            params['expand'] = expand
+        page = await self._get_json(session, "search", params)
+        return page['issues'], page.get('total')
+
+    async def _fetch_changelogs(self, session, issues):
+        """Fill in the changelogs JIRA truncated for a page of issue JSON, all pages at once."""
+        tasks = []
+        for issue in issues:
+            for offset in _missing_changelog_offsets(issue.get('changelog') or {}, self.CHANGELOG_PAGE_SIZE):
+                tasks.append((issue, offset))
+        if not tasks:
+            return issues
+
+        results = await asyncio.gather(*[
+            self._get_json(
+                session,
+                "issue/{key}/changelog".format(key=issue['key']),
+                dict(startAt=offset, maxResults=self.CHANGELOG_PAGE_SIZE),
+            )
+            for issue, offset in tasks
+        ])
+        fetched = {}
+        for (issue, offset), page in zip(tasks, results):
+            fetched.setdefault(issue['key'], (issue, {}))[1][offset] = page['values']
+        for issue, pages in fetched.values():
+            _splice_changelog(issue['changelog'], pages)
+        return issues
+
+    async def _get_json(self, session, path, params):
+        """Return the decoded JSON of a REST API GET, retrying it while it is throttled."""
+        url = self._url.rstrip('/') + self.API_PATH + path
+        return await self.rate_controller.call_async(self._request_json, session, url, params)
+
+    async def _request_json(self, session, url, params):
+        async with self.semaphore:
+            async with session.get(url, params=params, headers=self._headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+
+class TicketStream(object):
+    """Async iterator of AgileTickets from an AsyncJIRAFetcher.
+
+    The first page is requested on its own to learn the total, then up to
+    `concurrency` further pages are kept in flight ahead of the consumer.
+    Use it with `async with` so an early exit cancels outstanding requests.
+    Keys seen again are skipped unless they were updated since, just like
+    JIRAFetcher.iter_fetch.
+    """
+
+    def __init__(self, fetcher, since=None, session=None):
+        """Create the stream, no requests are made until it is iterated."""
+        self._fetcher = fetcher
+        self._since = since
+        self._search_string = fetcher._search_string(since)
+        self._session = session
+        self._owns_session = session is None
+        self._tickets = deque()
+        self._pending = deque()
+        self._offsets = None
+        self._stride = 0
+        self._limit = 0
+        self._matches = None
+        self._seen = {}
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._tickets:
+            issues = await self._next_page()
+            if issues is None:
+                await self.aclose()
+                raise StopAsyncIteration
+            issues = [
+                i for i in issues
+                if i['key'] not in self._seen or _is_newer(parse_jira_datetime(i['fields']['updated']), self._seen[i['key']])
+            ]
+            for i in await self._fetcher._fetch_changelogs(self._session, issues):
+                key = i['key']
+                ticket = convert_jira_json(i)
+                self._seen[key] = ticket.updated_at
+                ticket.matched_filters = self._matches.get(key, []) if self._matches is not None else list(self._fetcher.filters)
+                self._tickets.append(ticket)
+        return self._tickets.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Cancel outstanding requests and close the session if the stream created it."""
+        while self._pending:
+            self._pending.popleft().cancel()
+        self._offsets = iter(())
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _next_page(self):
+        fetcher = self._fetcher
+        if self._offsets is None:
+            if self._session is None:
+                self._session = fetcher.make_session()
+            page_size = fetcher._limit_page_size(0, fetcher._page_size)
+            if page_size <= 0:
+                self._offsets = iter(())
+                return None
+            self._matches = await fetcher._fetch_matches(self._session, self._since)
+            issues, total = await fetcher._fetch_page(self._session, self._search_string, 0, page_size)
+            self._stride = len(issues)
+            self._limit = total if fetcher._max_results is None else min(total, fetcher._max_results)
+            self._offsets = iter(range(self._stride, self._limit, self._stride) if self._stride else ())
+            for _ in range(fetcher._concurrency):
+                self._schedule_next()
+            return issues
+
+        if not self._pending:
+            return None
+        issues, _ = await self._pending.popleft()
+        self._schedule_next()
+        return issues
+
+    def _schedule_next(self):
+        offset = next(self._offsets, None)
+        if offset is None:
+            return
+        page_size = min(self._stride, self._limit - offset)
+        self._pending.append(asyncio.ensure_future(
+            self._fetcher._fetch_page(self._session, self._search_string, offset, page_size)
+        ))
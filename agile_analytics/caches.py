@@ -0,0 +1,117 @@
+"""Remember analysis results between runs so only changed tickets are analyzed again."""
+
+import json
+import shelve
+from collections import OrderedDict
+
+
+class AnalysisCache(object):
+    """Cache the outcome of analyzing the latest version of each ticket.
+
+    Outcomes are keyed by the ticket's key together with the analyzer's
+    class, states_context and strategy, and stored with the ticket's
+    updated_at. A lookup only hits when updated_at matches, so a ticket is
+    analyzed again once it is updated or the analysis changes, and its new
+    outcome replaces the old one. Tickets without an updated_at are never
+    cached. A ticket's flow log is assumed not to change without its
+    updated_at changing too.
+
+    The most recently used outcomes are kept in memory. With a filename
+    they are also kept in a shelve database, for the next run to use.
+
+    Arguments:
+        maxsize (Optional[int]): Number of outcomes kept in memory, defaults to 10000
+        filename (Optional[str]): Path to a shelve database, created when missing. Defaults to
+            only caching in memory.
+
+    Attributes:
+        hits (int): Number of lookups that found an outcome
+        misses (int): Number of lookups that didn't
+    """
+
+    def __init__(self, maxsize=10000, filename=None):
+        """Create the cache, opening the shelve database when given a filename."""
+        self.maxsize = maxsize
+        self.filename = filename
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._shelf = None if filename is None else shelve.open(filename)
+
+    def context_key(self, analyzer, strategy):
+        """Return a string identifying how analyzer analyzes tickets with strategy.
+
+        It is built from names and states only, so it stays the same from one
+        process to the next.
+        """
+        klass = type(analyzer)
+        return json.dumps([
+            "{}.{}".format(klass.__module__, klass.__name__),
+            sorted((phase, list(states)) for phase, states in analyzer.states_context.items()),
+            strategy,
+        ])
+
+    def key(self, context_key, ticket):
+        """Return the key of ticket's outcome in the context, or None when it can't be cached."""
+        if ticket.updated_at is None:
+            return None
+        return "{}|{}".format(context_key, ticket.key)
+
+    def get(self, key, updated_at):
+        """Return the outcome cached for key when it was for the version updated at updated_at, or None.
+
+        Outcomes are an AnalyzedAgileTicket, or the name of the phase a
+        ticket was ignored for.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        elif self._shelf is not None:
+            entry = self._shelf.get(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        outcome = None
+        if entry is not None and entry[0] == updated_at:
+            outcome = entry[1]
+        if outcome is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return outcome
+
+    def put(self, key, updated_at, outcome):
+        """Cache the outcome of analyzing the version of a ticket updated at updated_at, replacing any other version's."""
+        entry = (updated_at, outcome)
+        self._remember(key, entry)
+        if self._shelf is not None:
+            self._shelf[key] = entry
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached outcome, on disk as well as in memory."""
+        self._memory.clear()
+        if self._shelf is not None:
+            self._shelf.clear()
+
+    def __len__(self):
+        if self._shelf is not None:
+            return len(self._shelf)
+        return len(self._memory)
+
+    def close(self):
+        """Flush and close the shelve database, if there is one."""
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,9 +1,23 @@
 """Fetch data from agile sources and return standard AgileTickets."""
 
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from glob import glob
+
 from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
 from jira import JIRA
+from requests.adapters import HTTPAdapter
 
-from .models import AgileTicket
+from .models import AgileTicket, FlowEntry, _is_newer, merge_tickets
+from .stats import FetchStats, PageStats
+from .throttling import RateController
 
 
 class BaseFetcher(object):
@@ -22,6 +36,52 @@ class BaseFetcher(object):
         raise NotImplementedError  # pragma: no cover
 
 
+_TIMEZONES = {}
+
+
+def _jira_timezone(offset):
+    """Return a memoized tzinfo for a +HHMM/-HHMM offset, matching what dateutil would build."""
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        seconds = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60
+        if offset[0] == '-':
+            seconds = -seconds
+        tz = tzutc() if seconds == 0 else tzoffset(None, seconds)
+        _TIMEZONES[offset] = tz
+    return tz
+
+
+def parse_jira_datetime(value):
+    """
+    Parse a JIRA timestamp like 2016-03-30T17:27:09.000+0000.
+
+    JIRA always uses that fixed layout, so it is sliced apart directly instead
+    of going through dateutil's generic parser, which is only used as a
+    fallback for anything else.
+
+    Args:
+        value (str): The timestamp
+
+    Returns:
+        datetime: Equal to, and with the same UTC offset as, what dateutil.parser.parse returns
+
+    Raises:
+        ValueError: When the value can't be parsed at all
+    """
+    separators = value[4:5] + value[7:8] + value[10:11] + value[13:14] + value[16:17] + value[19:20]
+    if len(value) == 28 and separators == '--T::.' and value[23] in '+-':
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                int(value[20:23]) * 1000,
+                _jira_timezone(value[23:]),
+            )
+        except ValueError:
+            pass
+    return parse(value)
+
+
 def convert_jira_issue(issue):
     """
     Convert a JIRA issue into a AgileTicket.
@@ -43,53 +103,172 @@ def convert_jira_issue(issue):
     t = AgileTicket(issue.key, ttype=ttype)
 
     t.title = issue.fields.summary
-    t.created_at = parse(issue.fields.created)
-    t.updated_at = parse(issue.fields.updated)
-    t.flow_log.append(
-        dict(
-            entered_at=t.created_at,
-            state=str("Created"),
-        )
-    )
+    t.created_at = parse_jira_datetime(issue.fields.created)
+    t.updated_at = parse_jira_datetime(issue.fields.updated)
+    entries = [FlowEntry(t.created_at, str("Created"))]
 
     for history in issue.changelog.histories:
         for item in history.items:
             if item.field == 'status':
-                t.flow_log.append(
-                    dict(
-                        entered_at=parse(history.created),
-                        state=str(item.toString)
-                    )
-                )
+                entries.append(FlowEntry(parse_jira_datetime(history.created), str(item.toString)))
 
+    t.flow_log.extend(entries, trusted=True)
     return t
 
 
-class JIRAFetcher(BaseFetcher):
-    """Fetch data from JIRA and transform it into AgileTickets.
+def convert_jira_json(raw):
+    """
+    Convert the decoded REST JSON of a JIRA issue into a AgileTicket.
+
+    Produces the same AgileTicket as convert_jira_issue without needing the
+    jira client to wrap the issue in resource objects first.
+
+    Args:
+        raw (dict): An issue from the search API, with the changelog expanded
+
+    Returns:
+        An AgileTicket instance
+
+    Raises:
+        None
+    """
+    fields = raw['fields']
+    try:
+        ttype = fields['issuetype']['name']
+    except (KeyError, TypeError):
+        ttype = "Ticket"
+
+    t = AgileTicket(raw['key'], ttype=ttype)
+
+    t.title = fields['summary']
+    t.created_at = parse_jira_datetime(fields['created'])
+    t.updated_at = parse_jira_datetime(fields['updated'])
+    entries = [FlowEntry(t.created_at, str("Created"))]
+
+    for history in raw.get('changelog', {}).get('histories', []):
+        for item in history['items']:
+            if item['field'] == 'status':
+                entries.append(FlowEntry(parse_jira_datetime(history['created']), str(item['toString'])))
+
+    t.flow_log.extend(entries, trusted=True)
+    return t
+
+
+def _issue_key(issue):
+    """Return the key of a jira.Issue or of its decoded JSON."""
+    if isinstance(issue, dict):
+        return issue['key']
+    return issue.key
+
+
+def _issue_updated(issue):
+    """Return the parsed updated timestamp of a jira.Issue or of its decoded JSON."""
+    if isinstance(issue, dict):
+        return parse_jira_datetime(issue['fields']['updated'])
+    return parse_jira_datetime(issue.fields.updated)
+
+
+PAGE_FILENAME = "page-{number:05d}.json"
+PAGE_GLOB = "page-*.json"
+
+
+def clear_pages(directory):
+    """
+    Remove the pages recorded in directory, so a new recording doesn't replay with an old one.
+
+    Args:
+        directory (str): Where recorded pages are kept
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    for path in glob(os.path.join(directory, PAGE_GLOB)):
+        os.remove(path)
+
+
+def record_page(directory, number, issues, total=None):
+    """
+    Write a page of search results to disk for a ReplayFetcher to read back.
+
+    Args:
+        directory (str): Where recorded pages are kept, created when missing
+        number (int): The page's position in the search, pages replay in this order
+        issues (list): jira.Issues or their decoded JSON
+        total (Optional[int]): The total number of matches reported by the search
+
+    Returns:
+        str: The path of the page file
+
+    Raises:
+        None
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, PAGE_FILENAME.format(number=number))
+    page = dict(
+        total=total,
+        issues=[i if isinstance(i, dict) else i.raw for i in issues],
+    )
+    with open(path, 'w') as f:
+        json.dump(page, f)
+    return path
+
+
+def _missing_changelog_offsets(changelog, page_size):
+    """Return the startAt offsets of the changelog pages JIRA left out of an issue.
+
+    The embedded histories cover [startAt, startAt + len(histories)) of total.
+    """
+    total = changelog.get('total') or 0
+    histories = changelog.get('histories') or []
+    start_at = changelog.get('startAt') or 0
+    end_at = start_at + len(histories)
+    if total <= len(histories):
+        return []
+    offsets = list(range(0, start_at, page_size))
+    offsets.extend(range(end_at, total, page_size))
+    return offsets
+
+
+def _splice_changelog(changelog, pages):
+    """Combine the embedded histories with the pages fetched by _missing_changelog_offsets."""
+    start_at = changelog.get('startAt') or 0
+    before, after = [], []
+    for offset in sorted(pages):
+        target = before if offset < start_at else after
+        target.extend(pages[offset])
+    before = before[:start_at]
+    changelog['histories'] = before + changelog.get('histories', []) + after
+    changelog['startAt'] = 0
+    changelog['maxResults'] = len(changelog['histories'])
+
+
+class BaseJIRAFetcher(BaseFetcher):
+    """Base class for fetchers searching JIRA, whatever they make requests with.
+
+    Holds what the fetchers share: authentication, turning filters into one
+    JQL search, page limits and retrying throttled requests.
 
     Attributes:
-        jira_kwargs (dict): The arguments passed to the JIRA instance.
-        auth_kwargs (dict): The authentication kwargs passed to the JIRA instance
+        auth_kwargs (dict): The authentication kwargs for the JIRA client
+        filters (list): The filter IDs or JQL strings being fetched
+        fields (list): The issue fields requested by searches
+        rate_controller (RateController): Retries throttled requests
     """
 
     BASIC_AUTH_KEYS = ['username', 'password']
     OAUTH_KEYS = ['access_token', 'access_token_secret', 'consumer_key', 'key_cert']
+    JQL_DATE_FORMAT = "%Y/%m/%d %H:%M"
+    SINCE_MARGIN = timedelta(days=1)
+    DEFAULT_FIELDS = ['summary', 'created', 'updated', 'issuetype']
+    KEY_PAGE_SIZE = 1000
+    CHANGELOG_PAGE_SIZE = 100
+    ORDER_BY = re.compile(r"\s+order\s+by\s+", re.IGNORECASE)
 
-    def __init__(self, url, auth, filter_id, max_results=999, jira_kwargs=None):
-        """Create JIRAFetcher.
-
-        Args:
-            url (str): Fully qualified URL include http/https scheme to your JIRA instance
-            auth (dict): Dictionary of authentication credentials. Either username/password keys
-                for basic auth OR access_token/access_token_secret/consumer_key/key_cert for OAuth
-            filter_id (int): The JIRA filter ID of results you wish to fetch
-            max_results (Optional[int]): Number of results to fetch, defaults to 999
-            jira_kwargs (Optional[dict]): Additional kwargs passed to the jira.JIRA class
-                at instance creation
-
-        Returns:
-            JIRAFetcher: instance
+    def __init__(self, url, auth, filter_id, max_results=None, page_size=100, concurrency=1, fields=None, rate_controller=None):
+        """Create the fetcher, see JIRAFetcher for the arguments.
 
         Raises:
             TypeError: When neither Basic nor Oauth keys were provided in the auth dict
@@ -98,10 +277,16 @@ class JIRAFetcher(BaseFetcher):
         self._auth = auth
         self.auth_kwargs = {}
         self._validate_auth()
-        self._filter_id = int(filter_id)
-        self.jira_kwargs = jira_kwargs or {}
-        self.jira_kwargs.update(self.auth_kwargs)
+        self.filters = list(filter_id) if isinstance(filter_id, (list, tuple)) else [filter_id]
+        self._queries = [self._parse_filter(f) for f in self.filters]
         self._max_results = max_results
+        self._page_size = page_size
+        self._concurrency = max(1, int(concurrency))
+        self.rate_controller = rate_controller or RateController(max_concurrency=self._concurrency)
+        self.fields = list(self.DEFAULT_FIELDS)
+        for field in fields or []:
+            if field not in self.fields:
+                self.fields.append(field)
 
     def _validate_auth(self):
         if set(self._auth.keys()) <= set(self.BASIC_AUTH_KEYS):
@@ -111,7 +296,106 @@ class JIRAFetcher(BaseFetcher):
         else:
             raise TypeError("Neither %s nor %s found in auth parameter" % (self.BASIC_AUTH_KEYS, self.OAUTH_KEYS))
 
-    # TODO: Needs tests
+    def _parse_filter(self, value):
+        """Return the (where, order by) JQL clauses for a filter ID or raw JQL string."""
+        if isinstance(value, str) and not value.strip().isdigit():
+            parts = self.ORDER_BY.split(value.strip(), 1)
+            return parts[0], parts[1] if len(parts) > 1 else None
+        return "filter={filter_id}".format(filter_id=int(value)), None
+
+    def _search_string(self, since=None, queries=None):
+        """Return the JQL searching every query, for tickets updated since when given.
+
+        JQL date literals are read in the JIRA user's timezone. since is
+        written in UTC and SINCE_MARGIN earlier, so the search covers it from
+        any timezone at most a day behind UTC instead of silently skipping
+        tickets updated in the difference.
+        """
+        queries = self._queries if queries is None else queries
+        if len(queries) == 1:
+            search_string = queries[0][0]
+        else:
+            search_string = " OR ".join("({})".format(where) for where, _ in queries)
+        if since is not None:
+            if " " in search_string:  # Anything beyond a bare filter=N needs grouping before AND
+                search_string = "({})".format(search_string)
+            if since.tzinfo is not None:
+                since = since.astimezone(tzutc())
+            since -= self.SINCE_MARGIN
+            search_string += ' AND updated >= "{since}"'.format(since=since.strftime(self.JQL_DATE_FORMAT))
+        order_bys = [order_by for _, order_by in queries if order_by]
+        if order_bys:
+            search_string += " ORDER BY " + order_bys[0]
+        return search_string
+
+    def _limit_page_size(self, start_at, page_size):
+        if self._max_results is None:
+            return page_size
+        return min(page_size, self._max_results - start_at)
+
+
+class JIRAFetcher(BaseJIRAFetcher):
+    """Fetch data from JIRA and transform it into AgileTickets.
+
+    Attributes:
+        jira_kwargs (dict): The arguments passed to the JIRA instance.
+        auth_kwargs (dict): The authentication kwargs passed to the JIRA instance
+        stats (FetchStats): Per-page request latency, response size and conversion time of the latest fetch
+    """
+
+    DEFAULT_POOL_SIZE = 10
+
+    def __init__(self, url, auth, filter_id, max_results=None, jira_kwargs=None, page_size=100, concurrency=1, fields=None, raw=False, rate_controller=None, record_to=None, pool_size=None, on_page=None):
+        """Create JIRAFetcher.
+
+        Args:
+            url (str): Fully qualified URL include http/https scheme to your JIRA instance
+            auth (dict): Dictionary of authentication credentials. Either username/password keys
+                for basic auth OR access_token/access_token_secret/consumer_key/key_cert for OAuth
+            filter_id (int|str|list): The JIRA filter ID of results you wish to fetch, a raw JQL
+                string, or a list of either whose results are fetched together without duplicates
+            max_results (Optional[int]): Maximum number of results to fetch, defaults to all of them
+            jira_kwargs (Optional[dict]): Additional kwargs passed to the jira.JIRA class
+                at instance creation. max_retries defaults to 0, so throttled requests are
+                retried by the rate controller alone.
+            page_size (Optional[int]): Number of results requested per search call, defaults to 100
+            concurrency (Optional[int]): Number of pages fetched in parallel once the total is known, defaults to 1
+            fields (Optional[list]): Extra issue fields to request on top of DEFAULT_FIELDS, the ones
+                convert_jira_issue reads
+            raw (Optional[bool]): Work on the decoded search JSON with convert_jira_json instead of
+                having the jira client build Issue objects, defaults to False
+            rate_controller (Optional[RateController]): Retries throttled searches and adapts how many
+                run at once, defaults to one allowing up to `concurrency` searches in flight
+            record_to (Optional[str]): Directory to record each page of search results to, for
+                replaying later with a ReplayFetcher. Pages left there by an earlier recording are
+                removed when a fetch starts
+            pool_size (Optional[int]): Number of keep-alive connections the client's HTTP session
+                keeps open, defaults to DEFAULT_POOL_SIZE or `concurrency` when that is larger
+            on_page (Optional[callable]): Called with the PageStats of each page once it is converted
+
+        Returns:
+            JIRAFetcher: instance
+
+        Raises:
+            TypeError: When neither Basic nor Oauth keys were provided in the auth dict
+        """
+        super(JIRAFetcher, self).__init__(
+            url, auth, filter_id,
+            max_results=max_results, page_size=page_size, concurrency=concurrency, fields=fields, rate_controller=rate_controller,
+        )
+        self.jira_kwargs = jira_kwargs or {}
+        self.jira_kwargs.update(self.auth_kwargs)
+        # Leave retrying throttled requests to the rate controller rather than the jira client's session
+        self.jira_kwargs.setdefault('max_retries', 0)
+        self.raw = raw
+        self.record_to = record_to
+        self.pool_size = pool_size or max(self.DEFAULT_POOL_SIZE, self._concurrency)
+        self.on_page = on_page
+        self.stats = FetchStats()
+        self._responses = threading.local()
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
     def fetch(self, jira_klass=JIRA):
         """Fetch data and return AgileTickets.
 
@@ -124,13 +408,358 @@ class JIRAFetcher(BaseFetcher):
         Raises:
             None
         """
-        j = jira_klass(
-            server=self._url,
-            **self.jira_kwargs
-        )
-        search_string = "filter={filter_id}".format(filter_id=self._filter_id)
-        issues = j.search_issues(search_string, maxResults=self._max_results, expand="changelog")
-        tickets = []
-        for i in issues:
-            tickets.append(convert_jira_issue(i))
+        return merge_tickets(self.iter_fetch(jira_klass=jira_klass))
+
+    def fetch_incremental(self, store, jira_klass=JIRA):
+        """Fetch only the tickets updated since the store's watermark and merge them into it.
+
+        The first run against an empty store fetches everything. JQL reads
+        dates in the JIRA user's timezone, which the watermark can't be written
+        in, so the search starts SINCE_MARGIN before it. Tickets updated in that
+        margin are fetched again and merged harmlessly.
+
+        Args:
+            store (BaseTicketStore): Where previously fetched tickets are kept
+            jira_klass (Optional[JIRA]): jira.JIRA compatible class to be used for a JIRA connection
+
+        Returns:
+            list: List of the changed AgileTicket instances or empty list
+
+        Raises:
+            None
+        """
+        tickets = merge_tickets(self.iter_fetch(jira_klass=jira_klass, since=store.watermark))
+        store.merge(tickets)
         return tickets
+
+    def iter_fetch(self, jira_klass=JIRA, since=None):
+        """Fetch data a page at a time, yielding AgileTickets as they are converted.
+
+        Only one page of raw issues is held at a time (or `concurrency` pages
+        when fetching in parallel), so memory stays flat regardless of how
+        many issues the filter matches.
+
+        Several filters are fetched as one combined search, so tickets they
+        share are only downloaded and converted once. Each ticket's
+        matched_filters is found beforehand with cheap key-only searches. A
+        key seen again while paging is skipped unless it was updated since,
+        in which case the newer version is yielded too; fetch() keeps only
+        the newest.
+
+        Every page's request latency, decoding time, response size and conversion time is
+        recorded in `stats` and passed to `on_page` before its tickets are
+        yielded.
+
+        Args:
+            jira_klass (Optional[JIRA]): jira.JIRA compatible class to be used for a JIRA connection
+            since (Optional[datetime]): Only fetch tickets updated at or after this time
+
+        Yields:
+            AgileTicket: One per issue matched by the filter
+
+        Raises:
+            None
+        """
+        self.stats = stats = FetchStats()
+        if self.record_to:
+            clear_pages(self.record_to)
+        j = self.client(jira_klass)
+        matches = self._match_filters(j, since)
+        search_string = self._search_string(since)
+        for tickets, page in self._convert_pages(self._new_pages(j, search_string)):
+            stats.add(page)
+            if self.on_page is not None:
+                self.on_page(page)
+            for ticket in tickets:
+                ticket.matched_filters = matches.get(ticket.key, []) if matches is not None else list(self.filters)
+                yield ticket
+            tickets = None
+        stats.finish()
+
+    def _new_pages(self, j, search_string):
+        """Yield (issues, PageStats) for each page, dropping keys seen on earlier pages unless updated since."""
+        seen = {}
+        for number, (issues, total, page) in enumerate(self._iter_pages(j, search_string)):
+            page.number = number
+            issues = [i for i in issues if _issue_key(i) not in seen or _is_newer(_issue_updated(i), seen[_issue_key(i)])]
+            started = time.perf_counter()
+            issues = self._complete_changelogs(j, issues)
+            page.changelog_seconds = time.perf_counter() - started
+            if self.record_to:
+                record_page(self.record_to, number, issues, total)
+            for i in issues:
+                seen[_issue_key(i)] = _issue_updated(i)
+            yield issues, page
+            issues = None
+
+    def _convert_pages(self, pages):
+        """Yield (AgileTickets, PageStats) for each page of issues, in order."""
+        for issues, page in pages:
+            started = time.perf_counter()
+            tickets = [convert_jira_json(i) if isinstance(i, dict) else convert_jira_issue(i) for i in issues]
+            page.convert_seconds = time.perf_counter() - started
+            yield tickets, page
+
+    def client(self, jira_klass=JIRA):
+        """Return this fetcher's jira_klass client, creating it on first use.
+
+        The client is kept for later fetches, so authentication, server info
+        probing and TLS handshakes only happen once. Its HTTP session gets a
+        connection pool of pool_size kept-alive connections, enough for every
+        concurrent request to reuse one.
+
+        Args:
+            jira_klass (Optional[JIRA]): jira.JIRA compatible class to be used for a JIRA connection
+
+        Returns:
+            JIRA: The client instance
+        """
+        with self._clients_lock:
+            j = self._clients.get(jira_klass)
+            if j is None:
+                j = jira_klass(
+                    server=self._url,
+                    **self.jira_kwargs
+                )
+                session = getattr(j, '_session', None)
+                if session is not None:
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.hooks['response'].append(self._note_response)
+                self._clients[jira_klass] = j
+            return j
+
+    def _note_response(self, response, *args, **kwargs):
+        """Session hook adding each response's size to the current thread's count and noting when it arrived.
+
+        Throttled responses are left out, the request is retried and only the
+        response that is finally decoded counts.
+        """
+        if response.status_code in self.rate_controller.THROTTLE_STATUSES:
+            return
+        self._responses.count = (getattr(self._responses, 'count', None) or 0) + len(response.content)
+        self._responses.arrived = time.perf_counter()
+
+    def close(self):
+        """Close the clients this fetcher created and their connections."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for j in clients:
+            close = getattr(j, 'close', None)
+            if close is not None:
+                close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _match_filters(self, j, since=None):
+        """Return a dict of issue key to the filters matching it, or None with only one filter."""
+        if len(self._queries) == 1:
+            return None
+        search_strings = [self._search_string(since, queries=[(where, None)]) for where, _ in self._queries]
+        matches = {}
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            for label, keys in zip(self.filters, pool.map(lambda s: self._scan_keys(j, s), search_strings)):
+                for key in keys:
+                    matches.setdefault(key, []).append(label)
+        return matches
+
+    def _scan_keys(self, j, search_string):
+        """Return the keys of every issue matching search_string, skipping fields and changelogs."""
+        keys = []
+        start_at = 0
+        while True:
+            issues, total = self._search_page(j, search_string, start_at, self.KEY_PAGE_SIZE, fields=['key'], expand=None)
+            keys.extend(_issue_key(i) for i in issues)
+            start_at += len(issues)
+            if not issues:
+                return keys
+            if total is not None and start_at >= total:
+                return keys
+            if total is None and len(issues) < self.KEY_PAGE_SIZE:
+                return keys
+
+    def _complete_changelogs(self, j, issues):
+        """Fill in the changelogs JIRA truncated for a page of issues.
+
+        JIRA embeds at most 100 histories per issue in search results. The
+        missing pages for every truncated issue on the page are requested
+        together on a thread pool from the dedicated changelog endpoint.
+        Truncated jira.Issues are swapped for their completed decoded JSON.
+        """
+        tasks = []
+        for n, issue in enumerate(issues):
+            raw = issue if isinstance(issue, dict) else getattr(issue, 'raw', None)
+            changelog = (raw or {}).get('changelog') or {}
+            for offset in _missing_changelog_offsets(changelog, self.CHANGELOG_PAGE_SIZE):
+                tasks.append((n, raw, offset))
+        if not tasks:
+            return issues
+
+        def fetch_histories(task):
+            n, raw, offset = task
+            path = "issue/{key}/changelog".format(key=raw['key'])
+            params = dict(startAt=offset, maxResults=self.CHANGELOG_PAGE_SIZE)
+            return self.rate_controller.call(j._get_json, path, params=params)['values']
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            results = list(pool.map(fetch_histories, tasks))
+
+        issues = list(issues)
+        fetched = OrderedDict()
+        for (n, raw, offset), histories in zip(tasks, results):
+            fetched.setdefault(n, (raw, {}))[1][offset] = histories
+        for n, (raw, pages) in fetched.items():
+            _splice_changelog(raw['changelog'], pages)
+            issues[n] = raw
+        return issues
+
+    def _search_page(self, j, search_string, start_at, page_size, fields=None, expand="changelog"):
+        """Return a page of issues and the total number of matches, if known."""
+        fields = self.fields if fields is None else fields
+        kwargs = dict(startAt=start_at, maxResults=page_size, fields=fields, expand=expand)
+        if self.raw:
+            page = self.rate_controller.call(j.search_issues, search_string, json_result=True, **kwargs)
+            return page['issues'], page.get('total')
+        issues = self.rate_controller.call(j.search_issues, search_string, **kwargs)
+        return issues, getattr(issues, 'total', None)
+
+    def _timed_search_page(self, j, search_string, start_at, page_size):
+        """Return a page of issues, the total number of matches and the page's PageStats."""
+        self._responses.count = None
+        self._responses.arrived = None
+        started = time.perf_counter()
+        issues, total = self._search_page(j, search_string, start_at, page_size)
+        finished = time.perf_counter()
+        arrived = self._responses.arrived or finished
+        page = PageStats(
+            start_at=start_at,
+            issues=len(issues),
+            response_bytes=self._responses.count,
+            request_seconds=arrived - started,
+            decode_seconds=finished - arrived,
+        )
+        return issues, total, page
+
+    def _iter_pages(self, j, search_string):
+        """Yield (issues, total, PageStats) for each page of search results, in order.
+
+        The first page is always fetched on its own to learn the total. When
+        concurrency allows and the total is known, the remaining pages are
+        fetched on a thread pool sharing the one JIRA connection, with at most
+        `concurrency` pages in flight.
+        """
+        if self._max_results is not None and self._max_results <= 0:
+            return
+
+        issues, total, page = self._timed_search_page(j, search_string, 0, self._limit_page_size(0, self._page_size))
+        if self._concurrency > 1 and total is not None and len(issues) > 0:
+            stride = len(issues)
+            limit = total if self._max_results is None else min(total, self._max_results)
+            yield issues, total, page
+            issues = None
+            for page in self._iter_pages_concurrently(j, search_string, stride, limit, stride):
+                yield page
+            return
+
+        start_at = 0
+        while True:
+            count = len(issues)
+            requested = self._limit_page_size(start_at, self._page_size)
+            yield issues, total, page
+            issues = None
+
+            start_at += count
+            if count == 0:
+                break
+            if total is None and count < requested:
+                break
+            if total is not None and start_at >= total:
+                break
+            if self._max_results is not None and start_at >= self._max_results:
+                break
+            issues, total, page = self._timed_search_page(j, search_string, start_at, self._limit_page_size(start_at, self._page_size))
+
+    def _iter_pages_concurrently(self, j, search_string, start_at, limit, stride):
+        offsets = iter(range(start_at, limit, stride))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            def submit(offset):
+                page_size = min(stride, limit - offset)
+                pending.append(pool.submit(self._timed_search_page, j, search_string, offset, page_size))
+
+            for offset in offsets:
+                submit(offset)
+                if len(pending) >= self._concurrency:
+                    break
+
+            while pending:
+                page = pending.popleft().result()
+                offset = next(offsets, None)
+                if offset is not None:
+                    submit(offset)
+                yield page
+
+
+class ReplayFetcher(BaseFetcher):
+    """Replay search results recorded by a JIRAFetcher(record_to=...) without touching the network.
+
+    Pages go through convert_jira_json just like a live raw fetch, so runs
+    are repeatable and only measure conversion and whatever comes after it.
+
+    Attributes:
+        directory (str): Where the recorded pages are kept
+    """
+
+    def __init__(self, directory):
+        """Create ReplayFetcher.
+
+        Args:
+            directory (str): Where the recorded pages are kept
+
+        Returns:
+            ReplayFetcher: instance
+
+        Raises:
+            None
+        """
+        self.directory = directory
+
+    @property
+    def pages(self):
+        """list[str]: Paths of the recorded page files, in replay order."""
+        return sorted(glob(os.path.join(self.directory, PAGE_GLOB)))
+
+    def fetch(self):
+        """Replay every recorded page and return AgileTickets.
+
+        Returns:
+            list: List of AgileTicket instances or empty list
+
+        Raises:
+            None
+        """
+        return merge_tickets(self.iter_fetch())
+
+    def iter_fetch(self):
+        """Replay recorded pages one at a time, yielding AgileTickets as they are converted.
+
+        Yields:
+            AgileTicket: One per recorded issue
+
+        Raises:
+            None
+        """
+        for path in self.pages:
+            for i in self.load_page(path)['issues']:
+                yield convert_jira_json(i)
+
+    def load_page(self, path):
+        """Return the decoded JSON of a recorded page."""
+        with open(path, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
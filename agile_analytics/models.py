@@ -1,22 +1,56 @@
 """Data models."""
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime
 
+from .symbols import STATES, TICKET_TYPES
 
-class AgileTicket(object):
+
+class _Slotted(object):
+    """Pickle support for classes keeping their attributes in __slots__.
+
+    Subclasses list '__dict__' in their __slots__ so extra attributes can
+    still be set, the dict is only created when one is. Pickles made before
+    the attributes moved into __slots__ still load.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if name != '__dict__' and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            attributes, slots = state
+            state = dict(attributes or {}, **(slots or {}))
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class AgileTicket(_Slotted):
     """Abstract representation of tickets in Agile systems.
 
     Attributes:
         key (unicode): Unique identifier for the ticket in its system of record
         created_at (datetime): When was the ticket created
         updated_at (datetime): When was the ticket last updated
-        type (str): The kind of ticket this is: Bug, Epic, Story, etc.
+        type (str): The kind of ticket this is: Bug, Epic, Story, etc. Interned in TICKET_TYPES.
+        type_code (int): The code of type in TICKET_TYPES
+        matched_filters (list): The filter IDs or JQL strings a fetch found the ticket with
 
     Optional Attributes:
         title (unicode): The title of the ticket
         type (unicode): A label of the type of ticket: Story, Epic, Defect
     """
 
+    __slots__ = ('key', 'title', 'created_at', 'updated_at', 'type_code', 'matched_filters', '_flow_log', '__dict__')
+
     def __init__(self, key, title="", ttype="Ticket"):
         """Init an AgileTicket.
 
@@ -28,27 +62,168 @@ class AgileTicket(object):
         self.created_at = None
         self.updated_at = None
         self.type = ttype
+        self.matched_filters = []
         self._flow_log = FlowLog()
 
+    def __getstate__(self):
+        # Codes are only meaningful within this process, so pickle the name
+        state = super(AgileTicket, self).__getstate__()
+        state['type'] = TICKET_TYPES.names[state.pop('type_code')]
+        return state
+
+    @property
+    def type(self):
+        """str: The kind of ticket this is, shared with every ticket of the same type."""
+        return TICKET_TYPES.names[self.type_code]
+
+    @type.setter
+    def type(self, value):
+        self.type_code = TICKET_TYPES.code(value)
+
+    @property
+    def state_index(self):
+        """dict: Each state code in STATES mapped to the ticket's entries for that state, in log order."""
+        return self._flow_log.state_index
+
     @property
     def flow_log(self):
-        """FlowLog[dict].
+        """FlowLog[FlowEntry].
 
-        A list of dicts guaranteed to have the following:
+        A list of FlowEntries, read like dicts, guaranteed to have the following:
             entered_at (datetime): When the ticket entered the state
             state (unicode): The name of the state the ticket entered
         """
         return self._flow_log
 
 
+class FlowEntry(Mapping):
+    """An immutable record of when a ticket entered a state.
+
+    Reads like the dict {'entered_at': ..., 'state': ...} it replaces, and
+    compares equal to it, but takes a fraction of the memory.
+
+    Attributes:
+        entered_at (datetime): When the ticket entered the state
+        state (unicode): The name of the state the ticket entered, interned in STATES
+        state_code (int): The code of state in STATES, cheaper to compare than the name
+    """
+
+    __slots__ = ('entered_at', 'state', 'state_code')
+    KEYS = ('entered_at', 'state')
+
+    def __init__(self, entered_at, state):
+        """Create a FlowEntry."""
+        code = None if state is None else STATES.code(state)
+        object.__setattr__(self, 'entered_at', entered_at)
+        object.__setattr__(self, 'state', state if code is None else STATES.names[code])
+        object.__setattr__(self, 'state_code', code)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FlowEntry is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FlowEntry is immutable")
+
+    def __getitem__(self, key):
+        if key == 'state':
+            return self.state
+        if key == 'entered_at':
+            return self.entered_at
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        if isinstance(other, FlowEntry):
+            return self.entered_at == other.entered_at and self.state_code == other.state_code
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((self.entered_at, self.state))
+
+    def __repr__(self):
+        """Represention of the object."""
+        return "FlowEntry(entered_at={!r}, state={!r})".format(self.entered_at, self.state)
+
+    def __reduce__(self):
+        return (FlowEntry, (self.entered_at, self.state))
+
+
 class FlowLog(list):
-    """List subclass enforcing dictionaries with specific keys are added to it."""
+    """List subclass enforcing dictionaries with specific keys are added to it.
+
+    Entries are stored as FlowEntries, kept sorted by entered_at. Entries
+    entered at the same time stay in the order they were added.
+    """
+
+    __slots__ = ('_index', )
+
+    def __init__(self, entries=(), trusted=False):
+        """Create a FlowLog, optionally with entries as if passed to extend."""
+        super(FlowLog, self).__init__()
+        self._index = None
+        if entries:
+            self.extend(entries, trusted=trusted)
+
+    @property
+    def state_index(self):
+        """dict: Each state code in STATES mapped to the entries for that state, in log order.
 
-    def append(self, value):
+        Built on first use and kept until the log changes.
+        """
+        index = self._index
+        if index is None:
+            index = {}
+            for entry in self:
+                index.setdefault(entry.state_code, []).append(entry)
+            self._index = index
+        return index
+
+    def __reduce__(self):
+        return (self.__class__, (list(self), ))
+
+    def append(self, value, trusted=False):
         """Add items to the list.
 
+        The entry is inserted after any entered at the same time or earlier,
+        found with a binary search rather than re-sorting the whole log.
+
+        Args:
+            value (dict|FlowEntry): Must contain an entered_at and state key.
+            trusted (Optional[bool]): Skip validating value, for callers that built it with an
+                entered_at datetime and a state string themselves. Defaults to False.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Flow log items must have a 'entered_at' datetime and a 'state' string.
+        """
+        value = self._entry(value, trusted)
+        entered_at = value.entered_at
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if entered_at < self[mid].entered_at:
+                hi = mid
+            else:
+                lo = mid + 1
+        self._index = None
+        super(FlowLog, self).insert(lo, value)
+
+    def extend(self, values, trusted=False):
+        """Add several items to the list, sorting once at the end.
+
+        Gives the same log as appending each item in turn.
+
         Args:
-            value (dict): Must contain an entered_at and state key.
+            values (iterable[dict|FlowEntry]): Each must contain an entered_at and state key.
+            trusted (Optional[bool]): Skip validating values, for callers that built them with
+                entered_at datetimes and state strings themselves. Defaults to False.
 
         Returns:
             None
@@ -56,41 +231,117 @@ class FlowLog(list):
         Raises:
             TypeError: Flow log items must have a 'entered_at' datetime and a 'state' string.
         """
-        try:
-            ('entered_at', 'state') in value.keys()
-        except AttributeError:
+        values = [self._entry(value, trusted) for value in values]
+        super(FlowLog, self).extend(values)
+        self.sort(key=lambda entry: entry.entered_at)
+
+    def insert(self, index, value):
+        """Insert an item before index, validating it as append does.
+
+        Raises:
+            TypeError: Flow log items must have a 'entered_at' datetime and a 'state' string.
+        """
+        value = self._entry(value)
+        self._index = None
+        super(FlowLog, self).insert(index, value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [self._entry(v) for v in value]
+        else:
+            value = self._entry(value)
+        self._index = None
+        super(FlowLog, self).__setitem__(index, value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def _entry(self, value, trusted=False):
+        """Return value as a FlowEntry, validating it unless trusted."""
+        if trusted:
+            if type(value) is FlowEntry:
+                return value
+            return FlowEntry(value['entered_at'], value['state'])
+
+        if not hasattr(value, 'keys'):
             raise TypeError("Flow log items must have a 'entered_at' datetime and a 'state' string. Got: {value}".format(value=value))
 
         entered_at = value['entered_at']
-        try:
-            datetime.now(entered_at.tzinfo) - entered_at
-        except (AttributeError, TypeError) as e:
-            msgvars = dict(
+        if not isinstance(entered_at, datetime):
+            raise TypeError("Flow log items must have a entered_at datetime. Got: {val_type} / {val}".format(
                 val_type=type(entered_at),
                 val=entered_at,
-                exc=str(e)
-            )
-            raise TypeError("Flow log items must have a entered_at datetime. Got: {val_type} / {val}, \n Exception: {exc}".format(**msgvars))
+            ))
+
+        state = value['state']
+        if type(state) is not str:
+            state = str(state)
+        elif type(value) is FlowEntry:
+            return value
+        return FlowEntry(entered_at, state)
 
-        value[u'state'] = str(value['state'])
-        super(FlowLog, self).append(value)
-        self.sort(key=lambda l: l['entered_at'])
 
+def _invalidates_index(name):
+    """Wrap the list method name so calling it drops the FlowLog's cached state index."""
+    method = getattr(list, name)
 
-class AnalyzedAgileTicket(object):
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__delitem__', '__imul__', 'remove', 'pop', 'clear', 'sort', 'reverse'):
+    setattr(FlowLog, _name, _invalidates_index(_name))
+
+
+def merge_tickets(tickets):
+    """
+    De-duplicate tickets by key, keeping the most recently updated version of each.
+
+    Args:
+        tickets (iterable[AgileTicket]): Tickets that may contain the same key more than once
+
+    Returns:
+        list: AgileTickets in the order their keys were first seen
+
+    Raises:
+        None
+    """
+    merged = OrderedDict()
+    for ticket in tickets:
+        existing = merged.get(ticket.key)
+        if existing is None or _is_newer(ticket.updated_at, existing.updated_at):
+            merged[ticket.key] = ticket
+    return list(merged.values())
+
+
+def _is_newer(updated_at, than):
+    """Is updated_at newer than than, treating None as the oldest possible time."""
+    if updated_at is None:
+        return False
+    return than is None or updated_at > than
+
+
+class AnalyzedAgileTicket(_Slotted):
     """An AgileTicket analyzed within a certain context.
 
     Attributes:
         key (unicode): Unique identifier for the ticket in its system of record
-        committed (dict): The state and datetime when the story was committed
-        started (dict): The state and datetime when the story was started
-        ended (dict): The state and datetime when the story was ended
+        committed (FlowEntry): The state and datetime when the story was committed
+        started (FlowEntry): The state and datetime when the story was started
+        ended (FlowEntry): The state and datetime when the story was ended
 
     Optional Attributes:
         title (unicode): The title of the ticket
         type (unicode): A label of the type of ticket: Story, Epic, Defect
     """
 
+    __slots__ = ('key', 'title', 'committed', 'started', 'ended', 'type', '__dict__')
+
     def __init__(
         self, key, committed, started, ended,
         title="", ttype="Ticket",
@@ -0,0 +1,187 @@
+"""Save fetched AgileTickets to a compact snapshot file and load them back quickly."""
+
+import json
+import struct
+import zlib
+
+import numpy
+
+from .models import AgileTicket, FlowEntry
+from .stores import _timezone, _to_columns
+
+MAGIC = b"AGSNAP"
+VERSION = 1
+HEADER = struct.Struct("<6sHIQ")
+
+# int64 epoch microseconds marking a missing datetime, numpy's NaT
+NO_TIME = numpy.iinfo(numpy.int64).min
+
+CODE = numpy.dtype('<u4')
+MICROS = numpy.dtype('<i8')
+OFFSET_CODE = numpy.dtype('<u2')
+
+
+class _Interner(object):
+    """Give each distinct value a small integer code, in order of first appearance."""
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def dump_tickets(tickets, filename, level=6):
+    """
+    Write AgileTickets and their FlowLogs to a snapshot file.
+
+    The snapshot is columnar: states, types, UTC offsets and matched filters
+    are interned into tables and referred to by code, and every datetime is
+    an int64 of epoch microseconds plus the code of its UTC offset. The
+    columns are zlib compressed behind a versioned header that carries a
+    CRC32 of the uncompressed data.
+
+    Args:
+        tickets (list[AgileTicket]): The tickets to save
+        filename (str): Path of the snapshot file, replaced when it exists
+        level (Optional[int]): zlib compression level, defaults to 6
+
+    Returns:
+        int: The number of tickets written
+
+    Raises:
+        None
+    """
+    states, types, offsets, filters = _Interner(), _Interner(), _Interner(), _Interner()
+    keys, titles, matched, type_codes, lengths, state_codes, stamps, stamp_offsets = [], [], [], [], [], [], [], []
+
+    def add_stamp(value):
+        micros, offset = _to_columns(value)
+        stamps.append(NO_TIME if micros is None else micros)
+        stamp_offsets.append(offsets.code(offset))
+
+    for ticket in tickets:
+        keys.append(ticket.key)
+        titles.append(ticket.title)
+        matched.append([filters.code(f) for f in ticket.matched_filters])
+        type_codes.append(types.code(ticket.type))
+        add_stamp(ticket.created_at)
+        add_stamp(ticket.updated_at)
+        lengths.append(len(ticket.flow_log))
+        for entry in ticket.flow_log:
+            state_codes.append(states.code(entry['state']))
+            add_stamp(entry['entered_at'])
+
+    tables = json.dumps(dict(
+        keys=keys,
+        titles=titles,
+        matched_filters=matched,
+        states=states.values,
+        types=types.values,
+        offsets=offsets.values,
+        filters=filters.values,
+    )).encode('utf-8')
+    columns = [
+        numpy.array(type_codes, dtype=CODE),
+        numpy.array(lengths, dtype=CODE),
+        numpy.array(state_codes, dtype=CODE),
+        numpy.array(stamps, dtype=MICROS),
+        numpy.array(stamp_offsets, dtype=OFFSET_CODE),
+    ]
+    payload = b"".join([struct.pack("<Q", len(tables)), tables] + [column.tobytes() for column in columns])
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, zlib.crc32(payload), len(payload)))
+        f.write(zlib.compress(payload, level))
+    return len(keys)
+
+
+def load_tickets(filename, verify=True):
+    """
+    Read the AgileTickets written to a snapshot file by dump_tickets.
+
+    Timestamps are turned into datetimes a column at a time with numpy. When
+    the checksum verifies, FlowLog entries are trusted to be valid and sorted
+    already, so they are loaded without validating each one.
+
+    Args:
+        filename (str): Path of the snapshot file
+        verify (Optional[bool]): Check the snapshot's checksum, defaults to True. When False
+            every FlowLog entry is validated as it is loaded instead.
+
+    Returns:
+        list: List of AgileTicket instances or empty list
+
+    Raises:
+        ValueError: When the file isn't a snapshot, is a newer version or fails its checksum
+    """
+    with open(filename, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not a ticket snapshot".format(filename))
+        _, version, checksum, size = HEADER.unpack(header)
+        if version > VERSION:
+            raise ValueError("{} is snapshot version {}, only up to {} can be loaded".format(filename, version, VERSION))
+        payload = zlib.decompress(f.read())
+
+    trusted = False
+    if verify:
+        if len(payload) != size or zlib.crc32(payload) != checksum:
+            raise ValueError("{} failed its checksum".format(filename))
+        trusted = True
+
+    table_size, = struct.unpack_from("<Q", payload)
+    position = 8 + table_size
+    tables = json.loads(payload[8:position].decode('utf-8'))
+    count = len(tables['keys'])
+
+    def read(dtype, length):
+        nonlocal position
+        column = numpy.frombuffer(payload, dtype=dtype, count=length, offset=position)
+        position += column.nbytes
+        return column
+
+    type_codes = read(CODE, count).tolist()
+    lengths = read(CODE, count).tolist()
+    entries = sum(lengths)
+    state_codes = read(CODE, entries).tolist()
+    stamps = read(MICROS, entries + 2 * count)
+    stamp_offsets = read(OFFSET_CODE, entries + 2 * count)
+    datetimes = _datetimes(stamps, stamp_offsets, tables['offsets'])
+
+    states, types, filters = tables['states'], tables['types'], tables['filters']
+    tickets = []
+    entry = 0
+    n = 0
+    for i in range(count):
+        t = AgileTicket(tables['keys'][i], title=tables['titles'][i], ttype=types[type_codes[i]])
+        t.matched_filters = [filters[code] for code in tables['matched_filters'][i]]
+        t.created_at = datetimes[n]
+        t.updated_at = datetimes[n + 1]
+        n += 2
+        end = entry + lengths[i]
+        log = [FlowEntry(entered_at, states[code]) for entered_at, code in zip(datetimes[n:n + lengths[i]], state_codes[entry:end])]
+        n += lengths[i]
+        entry = end
+        t.flow_log.extend(log, trusted=trusted)
+        tickets.append(t)
+    return tickets
+
+
+def _datetimes(stamps, stamp_offsets, offsets):
+    """Turn epoch microseconds and offset codes into a list of datetimes, None for NO_TIME."""
+    seconds = numpy.array([offset or 0 for offset in offsets], dtype=MICROS)
+    local = stamps + seconds[stamp_offsets] * 1000000
+    local[stamps == NO_TIME] = NO_TIME
+    naive = local.astype('datetime64[us]').astype(object).tolist()
+    zones = [None if offset is None else _timezone(offset) for offset in offsets]
+    if len(zones) == 1 and zones[0] is None:
+        return naive
+    return [
+        value if tz is None or value is None else value.replace(tzinfo=tz)
+        for value, tz in zip(naive, [zones[code] for code in stamp_offsets.tolist()])
+    ]
@@ -0,0 +1,125 @@
+"""Measure where fetches spend their time."""
+
+import time
+
+
+class PageStats(object):
+    """Measurements for one page of search results.
+
+    Attributes:
+        number (int): The page's position in the fetch, counting from 0
+        start_at (int): Offset of the page's first issue in the search results
+        issues (int): Number of issues on the page
+        response_bytes (int): Size of the search response body, None when the client doesn't expose it
+        request_seconds (float): Time until the search response arrived, including throttled retries.
+            When the client doesn't expose its responses, decoding them is included too
+        decode_seconds (float): Time the client spent decoding the response once it arrived, building
+            jira.Issues included when not fetching raw
+        changelog_seconds (float): Time spent fetching changelog entries the search truncated
+        convert_seconds (float): Time spent turning the page's issues into AgileTickets, parsing their
+            dates included
+    """
+
+    def __init__(self, start_at=0, issues=0, response_bytes=None, request_seconds=0.0, decode_seconds=0.0):
+        """Create PageStats for a page that has just been requested."""
+        self.number = None
+        self.start_at = start_at
+        self.issues = issues
+        self.response_bytes = response_bytes
+        self.request_seconds = request_seconds
+        self.decode_seconds = decode_seconds
+        self.changelog_seconds = 0.0
+        self.convert_seconds = 0.0
+
+    @property
+    def seconds(self):
+        """float: Total time spent on the page."""
+        return self.request_seconds + self.decode_seconds + self.changelog_seconds + self.convert_seconds
+
+    @property
+    def issues_per_second(self):
+        """float: Issues handled per second spent on the page."""
+        return self.issues / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        """Represention of the object."""
+        return "<PageStats #{} issues={} response_bytes={} request={:.3f}s decode={:.3f}s changelog={:.3f}s convert={:.3f}s>".format(
+            self.number, self.issues, self.response_bytes, self.request_seconds, self.decode_seconds, self.changelog_seconds, self.convert_seconds,
+        )
+
+
+class FetchStats(object):
+    """Measurements for a whole fetch, a PageStats per page.
+
+    Pages fetched concurrently overlap, so the summed seconds can add up to
+    more than the elapsed time.
+
+    Attributes:
+        pages (list[PageStats]): The measurements of every page, in order
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """Start measuring a fetch.
+
+        Args:
+            clock (Optional[callable]): Returns the current time in seconds, defaults to time.perf_counter
+        """
+        self.pages = []
+        self._clock = clock
+        self._started = clock()
+        self._finished = None
+
+    def add(self, page):
+        """Record the measurements of a page."""
+        self.pages.append(page)
+
+    def finish(self):
+        """Stop the elapsed time clock."""
+        self._finished = self._clock()
+
+    @property
+    def elapsed(self):
+        """float: Wall clock seconds from the start of the fetch until it finished, or until now."""
+        return (self._clock() if self._finished is None else self._finished) - self._started
+
+    @property
+    def issues(self):
+        """int: Number of issues fetched."""
+        return sum(p.issues for p in self.pages)
+
+    @property
+    def response_bytes(self):
+        """int: Size of every search response body, None when the client doesn't expose them."""
+        sizes = [p.response_bytes for p in self.pages if p.response_bytes is not None]
+        return sum(sizes) if sizes else None
+
+    @property
+    def request_seconds(self):
+        """float: Time spent on search requests."""
+        return sum(p.request_seconds for p in self.pages)
+
+    @property
+    def decode_seconds(self):
+        """float: Time spent decoding search responses."""
+        return sum(p.decode_seconds for p in self.pages)
+
+    @property
+    def changelog_seconds(self):
+        """float: Time spent completing truncated changelogs."""
+        return sum(p.changelog_seconds for p in self.pages)
+
+    @property
+    def convert_seconds(self):
+        """float: Time spent converting issues into AgileTickets."""
+        return sum(p.convert_seconds for p in self.pages)
+
+    @property
+    def issues_per_second(self):
+        """float: Issues fetched per elapsed second."""
+        return self.issues / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        """Represention of the object."""
+        return "<FetchStats pages={} issues={} response_bytes={} elapsed={:.3f}s issues/s={:.1f}>".format(
+            len(self.pages), self.issues, self.response_bytes, self.elapsed, self.issues_per_second,
+        )
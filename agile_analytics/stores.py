@@ -0,0 +1,333 @@
+"""Keep AgileTickets around between runs so fetches only need what changed."""
+
+import json
+import shelve
+import sqlite3
+from datetime import datetime, timedelta
+from itertools import groupby
+
+from dateutil.tz import tzoffset, tzutc
+
+from .models import AgileTicket, FlowEntry, merge_tickets
+
+
+class BaseTicketStore(object):
+    """Base class for TicketStores.
+
+    A TicketStore holds AgileTickets keyed by AgileTicket.key along with a
+    watermark: the newest updated_at of any ticket it has seen.
+    """
+
+    def get(self, key):
+        """Return the stored AgileTicket for key or None."""
+        raise NotImplementedError  # pragma: no cover
+
+    def put(self, ticket):
+        """Store a single AgileTicket, replacing any with the same key."""
+        raise NotImplementedError  # pragma: no cover
+
+    def tickets(self):
+        """Return an iterable of every stored AgileTicket."""
+        raise NotImplementedError  # pragma: no cover
+
+    @property
+    def watermark(self):
+        """datetime: The newest updated_at merged into the store, or None when empty."""
+        raise NotImplementedError  # pragma: no cover
+
+    def set_watermark(self, value):
+        """Record the newest updated_at merged into the store."""
+        raise NotImplementedError  # pragma: no cover
+
+    def put_many(self, tickets):
+        """Store several AgileTickets, replacing any with the same keys.
+
+        When tickets holds a key more than once, its most recently updated version is stored.
+        """
+        for ticket in merge_tickets(tickets):
+            self.put(ticket)
+
+    def updated_ats(self, keys):
+        """Return a dict of key to updated_at for the stored tickets among keys."""
+        updated_ats = {}
+        for key in keys:
+            ticket = self.get(key)
+            if ticket is not None:
+                updated_ats[key] = ticket.updated_at
+        return updated_ats
+
+    def merge(self, tickets):
+        """Merge tickets into the store.
+
+        A stored ticket is only replaced when the incoming one is at least as
+        recently updated. The watermark advances to the newest updated_at seen.
+
+        Args:
+            tickets (list[AgileTicket]): The tickets to merge
+
+        Returns:
+            int: The number of tickets added or replaced
+        """
+        tickets = merge_tickets(tickets)
+        stored = self.updated_ats([t.key for t in tickets])
+        changed = [t for t in tickets if not _newer(stored.get(t.key), t.updated_at)]
+        self.put_many(changed)
+
+        watermark = self.watermark
+        for ticket in changed:
+            if _newer(ticket.updated_at, watermark):
+                watermark = ticket.updated_at
+        if watermark is not None and watermark != self.watermark:
+            self.set_watermark(watermark)
+        return len(changed)
+
+    def close(self):
+        """Release any resources held by the store."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _newer(left, right):
+    """Is the left datetime newer than the right one, treating None as oldest."""
+    if left is None:
+        return False
+    if right is None:
+        return True
+    return left > right
+
+
+class ShelveTicketStore(BaseTicketStore):
+    """Persist AgileTickets to a shelve database on disk.
+
+    Arguments:
+        filename (str): Path to the shelve database, created when missing.
+    """
+
+    WATERMARK_KEY = "__watermark__"
+
+    def __init__(self, filename):
+        """Open (or create) the store."""
+        self.filename = filename
+        self._shelf = shelve.open(filename)
+
+    def get(self, key):
+        """Return the stored AgileTicket for key or None."""
+        return self._shelf.get(str(key))
+
+    def put(self, ticket):
+        """Store a single AgileTicket, replacing any with the same key."""
+        self._shelf[ticket.key] = ticket
+
+    def tickets(self):
+        """Return a list of every stored AgileTicket."""
+        return [self._shelf[key] for key in self._shelf.keys() if key != self.WATERMARK_KEY]
+
+    @property
+    def watermark(self):
+        """datetime: The newest updated_at merged into the store, or None when empty."""
+        return self._shelf.get(self.WATERMARK_KEY)
+
+    def set_watermark(self, value):
+        """Record the newest updated_at merged into the store."""
+        self._shelf[self.WATERMARK_KEY] = value
+
+    def __len__(self):
+        return len([key for key in self._shelf.keys() if key != self.WATERMARK_KEY])
+
+    def close(self):
+        """Flush and close the shelve database."""
+        self._shelf.close()
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=tzutc())
+NAIVE_EPOCH = datetime(1970, 1, 1)
+_TIMEZONES = {0: tzutc()}
+
+
+def _to_columns(value):
+    """Split a datetime into (epoch microseconds, utc offset seconds) columns.
+
+    Naive datetimes are stored as if they were UTC with a NULL offset.
+    """
+    if value is None:
+        return None, None
+    if value.tzinfo is None:
+        delta = value - NAIVE_EPOCH
+        offset = None
+    else:
+        delta = value - EPOCH
+        offset = int(value.utcoffset().total_seconds())
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds, offset
+
+
+def _from_columns(micros, offset):
+    """Rebuild a datetime from the columns written by _to_columns."""
+    if micros is None:
+        return None
+    if offset is None:
+        return NAIVE_EPOCH + timedelta(microseconds=micros)
+    return (NAIVE_EPOCH + timedelta(seconds=offset, microseconds=micros)).replace(tzinfo=_timezone(offset))
+
+
+def _timezone(offset):
+    """Return a shared tzinfo for a UTC offset in seconds."""
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        tz = _TIMEZONES.setdefault(offset, tzoffset(None, offset))
+    return tz
+
+
+class TicketStore(BaseTicketStore):
+    """Persist AgileTickets and their FlowLogs to a SQLite database.
+
+    Writes are batched with executemany and reads stream tickets back one at a
+    time, so large stores never need to be held in memory all at once.
+
+    Arguments:
+        filename (str): Path to the SQLite database, created when missing. Defaults to an in-memory database.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tickets (
+            key TEXT PRIMARY KEY,
+            title TEXT,
+            type TEXT,
+            state TEXT,
+            created_at INTEGER,
+            created_offset INTEGER,
+            updated_at INTEGER,
+            updated_offset INTEGER,
+            matched_filters TEXT
+        );
+        CREATE INDEX IF NOT EXISTS tickets_updated_at ON tickets (updated_at);
+        CREATE INDEX IF NOT EXISTS tickets_state ON tickets (state);
+        CREATE TABLE IF NOT EXISTS flow_logs (
+            ticket_key TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            state TEXT,
+            entered_at INTEGER,
+            entered_offset INTEGER,
+            PRIMARY KEY (ticket_key, position)
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            name TEXT PRIMARY KEY,
+            micros INTEGER,
+            offset INTEGER
+        );
+    """
+
+    SELECT = """
+        SELECT t.key, t.title, t.type, t.created_at, t.created_offset, t.updated_at, t.updated_offset,
+               t.matched_filters, f.state, f.entered_at, f.entered_offset
+        FROM tickets t LEFT JOIN flow_logs f ON f.ticket_key = t.key
+        {where}
+        ORDER BY t.key, f.position
+    """
+
+    def __init__(self, filename=":memory:"):
+        """Open (or create) the store."""
+        self.filename = filename
+        self._db = sqlite3.connect(filename)
+        self._db.executescript(self.SCHEMA)
+
+    def get(self, key):
+        """Return the stored AgileTicket for key or None."""
+        for ticket in self._select("WHERE t.key = ?", (str(key), )):
+            return ticket
+        return None
+
+    def put(self, ticket):
+        """Store a single AgileTicket, replacing any with the same key."""
+        self.put_many([ticket])
+
+    def put_many(self, tickets):
+        """Store AgileTickets in a single transaction, replacing any with the same keys.
+
+        When tickets holds a key more than once, its most recently updated version is stored.
+        """
+        ticket_rows = []
+        flow_rows = []
+        for ticket in merge_tickets(tickets):
+            state = ticket.flow_log[-1]['state'] if ticket.flow_log else None
+            created_at, created_offset = _to_columns(ticket.created_at)
+            updated_at, updated_offset = _to_columns(ticket.updated_at)
+            ticket_rows.append((
+                ticket.key, ticket.title, ticket.type, state,
+                created_at, created_offset, updated_at, updated_offset,
+                json.dumps(ticket.matched_filters),
+            ))
+            for position, entry in enumerate(ticket.flow_log):
+                flow_rows.append((ticket.key, position, entry['state']) + _to_columns(entry['entered_at']))
+
+        with self._db:
+            self._db.executemany("DELETE FROM flow_logs WHERE ticket_key = ?", [(row[0], ) for row in ticket_rows])
+            self._db.executemany("INSERT OR REPLACE INTO tickets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", ticket_rows)
+            self._db.executemany("INSERT INTO flow_logs VALUES (?, ?, ?, ?, ?)", flow_rows)
+
+    def updated_ats(self, keys):
+        """Return a dict of key to updated_at for the stored tickets among keys."""
+        updated_ats = {}
+        keys = list(keys)
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            rows = self._db.execute(
+                "SELECT key, updated_at, updated_offset FROM tickets WHERE key IN ({})".format(", ".join("?" * len(batch))),
+                batch,
+            )
+            for key, micros, offset in rows:
+                updated_ats[key] = _from_columns(micros, offset)
+        return updated_ats
+
+    def tickets(self):
+        """Yield every stored AgileTicket, ordered by key."""
+        return self._select()
+
+    def updated_since(self, since):
+        """Yield the stored AgileTickets updated at or after since, ordered by key."""
+        micros, _ = _to_columns(since)
+        return self._select("WHERE t.updated_at >= ?", (micros, ))
+
+    def in_state(self, state):
+        """Yield the stored AgileTickets whose latest flow log entry is state, ordered by key."""
+        return self._select("WHERE t.state = ?", (str(state), ))
+
+    @property
+    def watermark(self):
+        """datetime: The newest updated_at merged into the store, or None when empty."""
+        row = self._db.execute("SELECT micros, offset FROM meta WHERE name = 'watermark'").fetchone()
+        if row is None:
+            return None
+        return _from_columns(*row)
+
+    def set_watermark(self, value):
+        """Record the newest updated_at merged into the store."""
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('watermark', ?, ?)", _to_columns(value))
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+
+    def close(self):
+        """Close the SQLite connection."""
+        self._db.close()
+
+    def _select(self, where="", params=()):
+        rows = self._db.execute(self.SELECT.format(where=where), params)
+        for key, ticket_rows in groupby(rows, key=lambda row: row[0]):
+            ticket = None
+            entries = []
+            for row in ticket_rows:
+                if ticket is None:
+                    ticket = AgileTicket(key, title=row[1], ttype=row[2])
+                    ticket.created_at = _from_columns(row[3], row[4])
+                    ticket.updated_at = _from_columns(row[5], row[6])
+                    ticket.matched_filters = json.loads(row[7])
+                if row[8] is not None:
+                    entries.append(FlowEntry(_from_columns(row[9], row[10]), row[8]))
+            ticket.flow_log.extend(entries, trusted=True)
+            yield ticket
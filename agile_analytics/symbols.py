@@ -0,0 +1,58 @@
+"""Share one copy of each state and ticket type name, numbered with small integer codes."""
+
+import threading
+
+
+class SymbolTable(object):
+    """Interns names and gives each a small integer code, in order of first appearance.
+
+    Lookups of names already in the table don't take a lock, only adding a
+    new name does. Codes are only meaningful within the process that
+    assigned them, so pickle names rather than codes.
+
+    Attributes:
+        names (list): The interned names, indexed by code
+    """
+
+    def __init__(self):
+        """Create an empty SymbolTable."""
+        self.names = []
+        self._codes = {}
+        self._lock = threading.Lock()
+
+    def code(self, name):
+        """Return the code of name, adding it to the table when it is new."""
+        code = self._codes.get(name)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(name)
+                if code is None:
+                    code = len(self.names)
+                    self.names.append(name)
+                    self._codes[name] = code
+        return code
+
+    def find(self, name):
+        """Return the code of name, or None when it has never been added."""
+        return self._codes.get(name)
+
+    def intern(self, name):
+        """Return the table's shared copy of name, adding it when it is new."""
+        return self.names[self.code(name)]
+
+    def name(self, code):
+        """Return the name with code."""
+        return self.names[code]
+
+    def __contains__(self, name):
+        return name in self._codes
+
+    def __len__(self):
+        return len(self.names)
+
+
+# The names of the states tickets move through, shared by every FlowEntry
+STATES = SymbolTable()
+
+# The names of ticket types, shared by every AgileTicket
+TICKET_TYPES = SymbolTable()
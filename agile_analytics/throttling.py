@@ -0,0 +1,181 @@
+"""Keep fetching when agile sources push back with rate limits."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+
+def status_code(exc):
+    """Return the HTTP status code carried by a request exception, if any."""
+    code = getattr(exc, 'status_code', None)
+    if code is None:
+        code = getattr(exc, 'status', None)
+    if code is None:
+        code = getattr(getattr(exc, 'response', None), 'status_code', None)
+    return code
+
+
+def retry_after(exc):
+    """Return the seconds a throttled response asked us to wait, or None.
+
+    Handles both forms of the Retry-After header: a number of seconds and an HTTP date.
+    """
+    # Prefer the response's headers, a JIRAError's own headers are the request's
+    headers = getattr(getattr(exc, 'response', None), 'headers', None)
+    if headers is None:
+        headers = getattr(exc, 'headers', None)
+    value = (headers or {}).get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(when.tzinfo)).total_seconds())
+
+
+class RateController(object):
+    """Retry throttled requests with backoff and adapt how many run at once.
+
+    Requests answered with a THROTTLE_STATUSES code are retried after the
+    server's Retry-After, or after a jittered exponential backoff when it
+    doesn't say. Concurrency adapts like AIMD: every throttle halves the number
+    of requests allowed in flight, and every success adds back a fraction so
+    it regrows by about one per round of requests, up to max_concurrency.
+
+    Attributes:
+        max_concurrency (int): The most requests ever allowed in flight.
+        limit (float): The number of requests currently allowed in flight.
+        requests (int): Number of requests attempted, including retries.
+        retries (int): Number of throttled requests that were retried.
+        throttled_seconds (float): Total time spent waiting out throttles.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, max_concurrency=1, max_retries=5, backoff=1.0, max_backoff=60.0, sleep=time.sleep, jitter=random.random):
+        """Create a RateController.
+
+        Args:
+            max_concurrency (Optional[int]): The most requests allowed in flight, defaults to 1
+            max_retries (Optional[int]): Retries per request before giving up and raising, defaults to 5
+            backoff (Optional[float]): Seconds the first backoff is based on, doubling each retry, defaults to 1
+            max_backoff (Optional[float]): The longest backoff in seconds, defaults to 60
+            sleep (Optional[callable]): Function used to wait, defaults to time.sleep
+            jitter (Optional[callable]): Returns a float in [0, 1) to scale backoffs by, defaults to random.random
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._jitter = jitter
+        self.limit = float(self.max_concurrency)
+        self.requests = 0
+        self.retries = 0
+        self.throttled_seconds = 0.0
+        self._in_flight = 0
+        self._lock = threading.Condition()
+
+    def call(self, func, *args, **kwargs):
+        """Call func, retrying it while it is throttled.
+
+        Raises:
+            Exception: Whatever func raised, once it isn't a throttle or retries are used up
+        """
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                throttled = status_code(e) in self.THROTTLE_STATUSES
+                self._release(succeeded=False, throttled=throttled)
+                if not throttled or attempt >= self.max_retries:
+                    raise
+                delay = self.delay(attempt, retry_after(e))
+            else:
+                self._release(succeeded=True)
+                return result
+            self._wait(delay)
+            attempt += 1
+
+    async def call_async(self, func, *args, **kwargs):
+        """Await func(*args, **kwargs), retrying it while it is throttled, like call does.
+
+        Retries, backoff and the adapted limit work the same way, but how
+        many coroutines are in flight is left to the caller, such as an
+        asyncio.Semaphore, since waiting on the limit would block the loop.
+
+        Raises:
+            Exception: Whatever func raised, once it isn't a throttle or retries are used up
+        """
+        attempt = 0
+        while True:
+            with self._lock:
+                self.requests += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                throttled = status_code(e) in self.THROTTLE_STATUSES
+                self._adapt(succeeded=False, throttled=throttled)
+                if not throttled or attempt >= self.max_retries:
+                    raise
+                delay = self.delay(attempt, retry_after(e))
+            else:
+                self._adapt(succeeded=True)
+                return result
+            with self._lock:
+                self.retries += 1
+                self.throttled_seconds += delay
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def delay(self, attempt, requested=None):
+        """Return the seconds to wait before retry number attempt (counting from 0).
+
+        Args:
+            attempt (int): How many times the request has been retried already
+            requested (Optional[float]): Seconds the server asked for with Retry-After, used as is
+        """
+        if requested is not None:
+            return requested
+        return self._jitter() * min(self.max_backoff, self.backoff * (2 ** attempt))
+
+    @property
+    def concurrency(self):
+        """int: The number of requests allowed in flight right now."""
+        return max(1, int(self.limit))
+
+    def _acquire(self):
+        with self._lock:
+            while self._in_flight >= self.concurrency:
+                self._lock.wait()
+            self._in_flight += 1
+            self.requests += 1
+
+    def _release(self, succeeded, throttled=False):
+        with self._lock:
+            self._in_flight -= 1
+            self._adapt(succeeded, throttled)
+            self._lock.notify_all()
+
+    def _adapt(self, succeeded, throttled=False):
+        with self._lock:
+            if throttled:
+                self.limit = max(1.0, self.limit / 2.0)
+            elif succeeded:
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+
+    def _wait(self, delay):
+        with self._lock:
+            self.retries += 1
+            self.throttled_seconds += delay
+        self._sleep(delay)
@@ -0,0 +1,61 @@
+"""Time DateAnalyzer on tickets with long flow logs and long state lists.
+
+Run with: python benchmarks/bench_analyze.py [number of tickets]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from dateutil.tz import tzutc
+
+from agile_analytics import BatchDateAnalyzer, DateAnalyzer
+from agile_analytics.models import AgileTicket
+
+TICKETS = 5000
+TRANSITIONS = 100
+STATES = ["State {}".format(n) for n in range(20)]
+ALIASES = 8
+
+
+def make_tickets(count=TICKETS, transitions=TRANSITIONS):
+    """Make tickets that cycle through STATES, then end in Done."""
+    start = datetime(2016, 1, 1, tzinfo=tzutc())
+    tickets = []
+    for n in range(count):
+        created = start + timedelta(minutes=n)
+        t = AgileTicket("BENCH-{}".format(n), ttype="Story")
+        t.created_at = created
+        entries = [dict(entered_at=created + timedelta(hours=h), state=STATES[(n + h) % len(STATES)]) for h in range(transitions)]
+        entries.append(dict(entered_at=created + timedelta(hours=transitions), state="Done"))
+        t.flow_log.extend(entries)
+        t.updated_at = created + timedelta(hours=transitions)
+        tickets.append(t)
+    return tickets
+
+
+def make_analyzer(klass=DateAnalyzer):
+    """Make an analyzer whose phases first list states only other projects' tickets use."""
+    def phase(state):
+        aliases = ["Alias {} of {}".format(n, state) for n in range(ALIASES)]
+        other_project = AgileTicket("OTHER-1")
+        other_project.flow_log.extend(dict(entered_at=datetime(2016, 1, 1), state=alias) for alias in aliases)
+        return aliases + [state]
+    return klass(commit_states=phase("State 3"), start_states=phase("State 7"), end_states=phase("Done"))
+
+
+def main(count=TICKETS):
+    """Print how long analysis takes, for each analyzer and strategy."""
+    tickets = make_tickets(int(count))
+    print("{} tickets with {} flow log entries, {} states per phase".format(len(tickets), TRANSITIONS + 1, ALIASES + 1))
+    for klass in (DateAnalyzer, BatchDateAnalyzer):
+        analyzer = make_analyzer(klass)
+        for strategy in (analyzer.OLDEST_DATE, analyzer.NEWEST_DATE):
+            started = time.perf_counter()
+            analyzed, ignored = analyzer.analyze(tickets, strategy=strategy)
+            print("{:<17} {:<7} {:8.3f} s".format(klass.__name__, strategy, time.perf_counter() - started))
+            assert len(analyzed) == len(tickets)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,41 @@
+"""Time re-analyzing tickets after a few changed, with and without an AnalysisCache.
+
+Run with: python benchmarks/bench_cache.py [number of tickets] [percent changed]
+"""
+
+import sys
+import time
+from datetime import timedelta
+
+from bench_analyze import make_analyzer, make_tickets
+
+from agile_analytics import AnalysisCache
+
+TICKETS = 20000
+CHURN = 2
+
+
+def main(count=TICKETS, churn=CHURN):
+    """Print how long a run takes analyzing every ticket, then only the changed ones."""
+    tickets = make_tickets(int(count))
+    analyzer = make_analyzer()
+    cache = AnalysisCache(maxsize=len(tickets))
+    analyzer.analyze(tickets, cache=cache)
+
+    step = max(1, int(100 / float(churn)))
+    for t in tickets[::step]:
+        t.updated_at += timedelta(minutes=1)
+    print("{} tickets, {} changed".format(len(tickets), len(tickets[::step])))
+
+    started = time.perf_counter()
+    expected = analyzer.analyze(tickets)
+    print("uncached {:8.3f} s".format(time.perf_counter() - started))
+
+    started = time.perf_counter()
+    actual = analyzer.analyze(tickets, cache=cache)
+    print("cached   {:8.3f} s".format(time.perf_counter() - started))
+    assert [a.key for a in actual[0]] == [a.key for a in expected[0]]
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
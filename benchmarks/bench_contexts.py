@@ -0,0 +1,51 @@
+"""Time analyzing several contexts with a DateAnalyzer each against one MultiContextAnalyzer.
+
+Run with: python benchmarks/bench_contexts.py [number of tickets]
+"""
+
+import sys
+import time
+
+from bench_analyze import STATES, make_tickets
+
+from agile_analytics import DateAnalyzer, MultiContextAnalyzer
+
+TICKETS = 20000
+
+
+def make_contexts(count):
+    """Make count contexts, the first phases shared between them as in a typical setup."""
+    contexts = {}
+    for n in range(count):
+        contexts["Context {}".format(n)] = (
+            [STATES[1], STATES[2]],
+            [STATES[3 + n % 10], STATES[4]],
+            ["Done"],
+        )
+    return contexts
+
+
+def main(count=TICKETS):
+    """Print how long analyzing 1, 3 and 6 contexts takes each way."""
+    tickets = make_tickets(int(count))
+    # Build every ticket's state index first, both ways use it
+    DateAnalyzer([STATES[0]], [STATES[0]], [STATES[0]]).analyze(tickets)
+    print("{} tickets with {} flow log entries".format(len(tickets), len(tickets[0].flow_log)))
+    for contexts in (1, 3, 6):
+        states = make_contexts(contexts)
+
+        started = time.perf_counter()
+        expected = {name: DateAnalyzer(*s).analyze(tickets) for name, s in states.items()}
+        separate = time.perf_counter() - started
+
+        started = time.perf_counter()
+        actual = MultiContextAnalyzer(states).analyze(tickets)
+        together = time.perf_counter() - started
+
+        assert sorted(actual) == sorted(expected)
+        assert all(len(actual[name][0]) == len(expected[name][0]) for name in states)
+        print("{} contexts: DateAnalyzers {:8.3f} s  MultiContextAnalyzer {:8.3f} s".format(contexts, separate, together))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
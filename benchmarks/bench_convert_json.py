@@ -0,0 +1,95 @@
+"""Compare converting search results via jira.Issue objects against convert_jira_json.
+
+Run with: python benchmarks/bench_convert_json.py
+"""
+
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+
+from jira.resources import Issue
+
+from agile_analytics.fetchers import convert_jira_issue, convert_jira_json
+
+ISSUES = 100
+HISTORIES = 30
+NUMBER = 5
+
+
+def make_page(issues=ISSUES, histories=HISTORIES):
+    """Make decoded search API JSON for a page of issues with long changelogs."""
+    start = datetime(2016, 3, 30, 17, 27, 9)
+    stamp = "{:%Y-%m-%dT%H:%M:%S}.000+0000"
+    return {
+        "startAt": 0,
+        "maxResults": issues,
+        "total": issues,
+        "issues": [
+            {
+                "key": "BENCH-{}".format(n),
+                "fields": {
+                    "summary": "Benchmark {}".format(n),
+                    "issuetype": {"name": "Story"},
+                    "created": stamp.format(start),
+                    "updated": stamp.format(start + timedelta(hours=histories)),
+                },
+                "changelog": {
+                    "startAt": 0,
+                    "maxResults": histories,
+                    "total": histories,
+                    "histories": [
+                        {
+                            "id": str(h),
+                            "author": {"name": "someone", "displayName": "Some One"},
+                            "created": stamp.format(start + timedelta(hours=h)),
+                            "items": [{
+                                "field": "status",
+                                "fieldtype": "jira",
+                                "from": "1",
+                                "fromString": "Open",
+                                "to": "3",
+                                "toString": "State {}".format(h % 5),
+                            }],
+                        }
+                        for h in range(histories)
+                    ],
+                },
+            }
+            for n in range(issues)
+        ],
+    }
+
+
+def via_issue(page):
+    """Build jira.Issue objects like the jira client does, then convert them."""
+    return [convert_jira_issue(Issue(None, None, raw=raw)) for raw in page["issues"]]
+
+
+def via_json(page):
+    """Convert the decoded JSON directly."""
+    return [convert_jira_json(raw) for raw in page["issues"]]
+
+
+def measure(convert, page):
+    """Return (seconds per page, peak bytes allocated) for a conversion path."""
+    seconds = min(timeit.repeat(lambda: convert(page), number=NUMBER, repeat=3)) / NUMBER
+    tracemalloc.start()
+    convert(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    """Print the cost of each conversion path."""
+    page = make_page()
+    issue_seconds, issue_peak = measure(via_issue, page)
+    json_seconds, json_peak = measure(via_json, page)
+    print("{} issues with {} status changes each".format(ISSUES, HISTORIES))
+    print("jira.Issue + convert_jira_issue: {:8.1f} ms/page {:8.1f} KiB peak".format(issue_seconds * 1e3, issue_peak / 1024.0))
+    print("convert_jira_json:               {:8.1f} ms/page {:8.1f} KiB peak".format(json_seconds * 1e3, json_peak / 1024.0))
+    print("speedup:                         {:8.1f}x".format(issue_seconds / json_seconds))
+
+
+if __name__ == "__main__":
+    main()
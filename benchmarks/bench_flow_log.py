@@ -0,0 +1,65 @@
+"""Compare the per-entry cost of the ways to build a long FlowLog.
+
+Run with: python benchmarks/bench_flow_log.py
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from agile_analytics.models import FlowLog
+
+TRANSITIONS = 500
+NUMBER = 20
+
+
+def make_entries(count=TRANSITIONS):
+    """Make status changes an hour apart, mostly in order like a changelog."""
+    start = datetime(2016, 1, 1)
+    entries = [dict(entered_at=start + timedelta(hours=n), state="State {}".format(n % 7)) for n in range(count)]
+    random.Random(0).shuffle(entries[:count // 10])
+    return entries
+
+
+def by_append(entries, trusted=False):
+    """Build a log by appending every entry."""
+    log = FlowLog()
+    for entry in entries:
+        log.append(dict(entry), trusted=trusted)
+    return log
+
+
+def by_extend(entries, trusted=False):
+    """Build a log with one extend."""
+    log = FlowLog()
+    log.extend((dict(entry) for entry in entries), trusted=trusted)
+    return log
+
+
+def validate(entries):
+    """Only validate every entry."""
+    log = FlowLog()
+    for entry in entries:
+        log._entry(entry)
+
+
+def main():
+    """Print the cost of each way of building a log."""
+    entries = make_entries()
+    assert by_append(entries) == by_extend(entries)
+    assert by_append(entries, trusted=True) == by_extend(entries, trusted=True)
+    print("{} entries".format(len(entries)))
+    cases = [
+        ("validate only", lambda: validate(entries)),
+        ("append", lambda: by_append(entries)),
+        ("append trusted", lambda: by_append(entries, trusted=True)),
+        ("extend", lambda: by_extend(entries)),
+        ("extend trusted", lambda: by_extend(entries, trusted=True)),
+    ]
+    for name, build in cases:
+        seconds = min(timeit.repeat(build, number=NUMBER, repeat=3)) / NUMBER
+        print("{:<15} {:8.3f} ms/log {:8.0f} ns/entry".format(name, seconds * 1e3, seconds * 1e9 / len(entries)))
+
+
+if __name__ == "__main__":
+    main()
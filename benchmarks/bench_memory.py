@@ -0,0 +1,63 @@
+"""Measure the memory held per AgileTicket and per AnalyzedAgileTicket.
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+
+from dateutil.tz import tzutc
+
+from agile_analytics import DateAnalyzer
+from agile_analytics.models import AgileTicket
+
+TICKETS = 20000
+STATES = ["Created", "Selected", "In Progress", "In QA", "In Progress", "In QA", "Done"]
+
+
+def make_tickets(count=TICKETS):
+    """Make tickets that walk through STATES a day apart.
+
+    Names are copied for every ticket, like decoding each one from JSON does.
+    """
+    start = datetime(2016, 1, 1, tzinfo=tzutc())
+    tickets = []
+    for n in range(count):
+        created = start + timedelta(minutes=n)
+        t = AgileTicket("BENCH-{}".format(n), title="Benchmark ticket {}".format(n), ttype=copy("Story"))
+        t.created_at = created
+        t.updated_at = created + timedelta(days=len(STATES))
+        t.flow_log.extend(dict(entered_at=created + timedelta(days=day), state=copy(state)) for day, state in enumerate(STATES))
+        tickets.append(t)
+    return tickets
+
+
+def copy(name):
+    """Return an equal string that isn't the same object."""
+    return name.encode('utf-8').decode('utf-8')
+
+
+def measure(build):
+    """Return the bytes still allocated after build() and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    """Print the bytes held per ticket before and after analysis."""
+    held, tickets = measure(make_tickets)
+    print("AgileTicket with {} flow log entries: {:6.0f} bytes".format(len(STATES), held / len(tickets)))
+    analyzer = DateAnalyzer(commit_states=["Selected"], start_states=["In Progress"], end_states=["Done"])
+    held, (analyzed, _) = measure(lambda: analyzer.analyze(tickets))
+    print("AnalyzedAgileTicket:                 {:6.0f} bytes".format(held / len(analyzed)))
+
+
+if __name__ == "__main__":
+    main()
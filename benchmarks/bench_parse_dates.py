@@ -0,0 +1,61 @@
+"""Compare convert_jira_issue using dateutil against the JIRA timestamp fast path.
+
+Run with: python benchmarks/bench_parse_dates.py
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from dateutil.parser import parse
+from pretend import stub
+
+from agile_analytics import fetchers
+
+HISTORIES = 50
+NUMBER = 200
+
+
+def make_issue(histories=HISTORIES):
+    """Make a stub jira issue with a long changelog."""
+    start = datetime(2016, 3, 30, 17, 27, 9)
+    stamp = "{:%Y-%m-%dT%H:%M:%S}.000+0000"
+    return stub(
+        key="BENCH-1",
+        fields=stub(
+            summary="Benchmark",
+            issuetype=stub(name="Story"),
+            created=stamp.format(start),
+            updated=stamp.format(start + timedelta(hours=histories)),
+        ),
+        changelog=stub(histories=[
+            stub(
+                created=stamp.format(start + timedelta(hours=n)),
+                items=[stub(field="status", fromString="Open", toString="State {}".format(n % 5))],
+            )
+            for n in range(histories)
+        ]),
+    )
+
+
+def per_ticket(parser, issue):
+    """Return the seconds spent converting one ticket with the given parser."""
+    fetchers.parse_jira_datetime, original = parser, fetchers.parse_jira_datetime
+    try:
+        return min(timeit.repeat(lambda: fetchers.convert_jira_issue(issue), number=NUMBER, repeat=3)) / NUMBER
+    finally:
+        fetchers.parse_jira_datetime = original
+
+
+def main():
+    """Print the per ticket conversion cost of each parser."""
+    issue = make_issue()
+    slow = per_ticket(parse, issue)
+    fast = per_ticket(fetchers.parse_jira_datetime, issue)
+    print("{} status changes per ticket".format(HISTORIES))
+    print("dateutil.parser.parse: {:8.1f} us/ticket".format(slow * 1e6))
+    print("parse_jira_datetime:   {:8.1f} us/ticket".format(fast * 1e6))
+    print("speedup:               {:8.1f}x".format(slow / fast))
+
+
+if __name__ == "__main__":
+    main()
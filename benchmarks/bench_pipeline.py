@@ -0,0 +1,75 @@
+"""Time conversion, analysis and reporting on their own by replaying recorded search pages.
+
+Run with: python benchmarks/bench_pipeline.py [recording directory]
+
+Without a directory a synthetic recording is made in a temporary directory.
+Record a real one with JIRAFetcher(..., record_to="some/dir").fetch().
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from agile_analytics import DateAnalyzer, LeadTimeDistributionReporter, ReplayFetcher
+from agile_analytics.fetchers import record_page
+
+PAGES = 50
+PAGE_SIZE = 100
+STATES = ["Open", "Selected", "In Progress", "In QA", "Done"]
+
+
+def make_recording(directory, pages=PAGES, page_size=PAGE_SIZE):
+    """Record synthetic search pages whose issues walk through STATES."""
+    start = datetime(2016, 1, 1)
+    stamp = "{:%Y-%m-%dT%H:%M:%S}.000+0000"
+    for number in range(pages):
+        issues = []
+        for n in range(page_size):
+            created = start + timedelta(hours=number * page_size + n)
+            histories = [
+                {
+                    "created": stamp.format(created + timedelta(days=day + 1)),
+                    "items": [{"field": "status", "fromString": "", "toString": state}],
+                }
+                for day, state in enumerate(STATES[1:])
+            ]
+            issues.append({
+                "key": "BENCH-{}".format(number * page_size + n),
+                "fields": {
+                    "summary": "Benchmark",
+                    "issuetype": {"name": "Story"},
+                    "created": stamp.format(created),
+                    "updated": stamp.format(created + timedelta(days=len(STATES))),
+                },
+                "changelog": {"startAt": 0, "maxResults": len(histories), "total": len(histories), "histories": histories},
+            })
+        record_page(directory, number, issues, total=pages * page_size)
+
+
+def timed(label, func, *args, **kwargs):
+    """Call func, print how long it took and return its result."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    print("{:<10} {:8.3f} s".format(label, time.perf_counter() - started))
+    return result
+
+
+def main(directory=None):
+    """Replay a recording through the pipeline, timing each stage."""
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix="agile-analytics-bench-")
+        make_recording(directory)
+
+    fetcher = ReplayFetcher(directory)
+    tickets = timed("convert", fetcher.fetch)
+    analyzer = DateAnalyzer(commit_states=["Selected"], start_states=["In Progress"], end_states=["Done"])
+    analyzed, ignored = timed("analyze", analyzer.analyze, tickets)
+    ended = [a.ended['entered_at'] for a in analyzed]
+    reporter = LeadTimeDistributionReporter(title="Lead time", start_date=min(ended), end_date=max(ended))
+    timed("report", reporter.report_on, analyzed)
+    print("{} tickets, {} analyzed, {} ignored".format(len(tickets), len(analyzed), len(ignored)))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,56 @@
+"""Compare saving and loading a fetch with pickle against dump_tickets/load_tickets.
+
+Run with: python benchmarks/bench_snapshots.py
+"""
+
+import os
+import pickle
+import tempfile
+import time
+
+from agile_analytics import dump_tickets, load_tickets
+
+from bench_convert_json import make_page, via_json
+
+PAGES = 50
+
+
+def timed(func, *args):
+    """Return (seconds, result) of calling func."""
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def dump_pickle(tickets, filename):
+    """Pickle tickets to filename."""
+    with open(filename, 'wb') as f:
+        pickle.dump(tickets, f, pickle.HIGHEST_PROTOCOL)
+
+
+def load_pickle(filename):
+    """Unpickle tickets from filename."""
+    with open(filename, 'rb') as f:
+        return pickle.load(f)
+
+
+def main():
+    """Print time and size of each snapshot format."""
+    page = make_page()
+    tickets = []
+    for n in range(PAGES):
+        for t in via_json(page):
+            t.key = "BENCH-{}-{}".format(n, t.key)
+            tickets.append(t)
+    directory = tempfile.mkdtemp(prefix="agile-analytics-bench-")
+    print("{} tickets with {} flow log entries".format(len(tickets), sum(len(t.flow_log) for t in tickets)))
+    for name, dump, load in [("pickle", dump_pickle, load_pickle), ("snapshot", dump_tickets, load_tickets)]:
+        filename = os.path.join(directory, name)
+        dumped, _ = timed(dump, tickets, filename)
+        loaded, result = timed(load, filename)
+        assert len(result) == len(tickets)
+        print("{:<9} dump {:7.3f} s load {:7.3f} s {:9.1f} KiB".format(name, dumped, loaded, os.path.getsize(filename) / 1024.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Shared fixtures."""
 import csv
+import random
 from os import path
 
 import pytest
@@ -124,3 +125,35 @@ def weeks_of_tickets(datetime, tzutc, AnalyzedAgileTicket):
         count += 1
 
     return parsed
+
+
+@pytest.fixture
+def random_tickets(Ticket, days_ago):
+    """Return tickets with random, repeated and tied states, some missing phases."""
+    rng = random.Random(42)
+    states = ["Created", "Selected", "To Do", "In Progress", "Dev In Progress", "Blocked", "Done", "Accepted"]
+    tickets = []
+    for n in range(200):
+        tickets.append(Ticket(
+            key="TEST-{}".format(n),
+            title="Ticket {}".format(n),
+            type=rng.choice(["Story", "Bug"]),
+            created_at=days_ago(30),
+            updated_at=days_ago(0),
+            flow_logs=[
+                dict(entered_at=days_ago(rng.randint(0, 10)), state=rng.choice(states))
+                for _ in range(rng.randint(0, 12))
+            ],
+        ))
+    return tickets
+
+
+@pytest.fixture
+def summary():
+    """Return a function giving everything an analysis produced in a comparable form."""
+    def _summary(analyzed, ignored):
+        return (
+            [(a.key, a.type, a.title, dict(a.committed), dict(a.started), dict(a.ended)) for a in analyzed],
+            [(id(i['ticket']), i['phase'], i['state_list']) for i in ignored],
+        )
+    return _summary
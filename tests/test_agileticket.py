@@ -101,3 +101,173 @@ def test_flow_log_ordered_ascending(make_one, days_ago):
         "SC"
     ]
     assert actual == expected
+
+
+def test_flow_log_append_ties_keep_order(make_one, days_ago):
+    """Ensure items entered at the same time stay in the order they were added."""
+    t = make_one()
+    for state, days in [("A", 2), ("B", 5), ("C", 2), ("D", 5), ("E", 9)]:
+        t.flow_log.append(dict(state=state, entered_at=days_ago(days)))
+
+    assert [fl['state'] for fl in t.flow_log] == ["E", "B", "D", "A", "C"]
+
+
+def test_flow_log_extend_matches_append(make_one, days_ago):
+    """Ensure extending gives the same log as appending one at a time."""
+    items = [
+        dict(state="SC", entered_at=days_ago(2)),
+        dict(state="KNAP", entered_at=days_ago(8)),
+        dict(state="Junohaki", entered_at=days_ago(8)),
+        dict(state="MA", entered_at=days_ago(10)),
+        dict(state="NH", entered_at=days_ago(2)),
+    ]
+    appended = make_one()
+    appended.flow_log.append(dict(state="ME", entered_at=days_ago(8)))
+    for i in items:
+        appended.flow_log.append(dict(i))
+    extended = make_one()
+    extended.flow_log.append(dict(state="ME", entered_at=days_ago(8)))
+    extended.flow_log.extend(dict(i) for i in items)
+
+    assert extended.flow_log == appended.flow_log
+    assert [fl['state'] for fl in extended.flow_log] == ["MA", "ME", "KNAP", "Junohaki", "SC", "NH"]
+
+
+def test_flow_log_extend_unhappy(make_one, datetime):
+    """Ensure extend validates every item and adds none when one is invalid."""
+    t = make_one()
+    with pytest.raises(TypeError):
+        t.flow_log.extend([
+            dict(state="OK", entered_at=datetime.now()),
+            dict(state="SD", entered_at=str(datetime.now())),
+        ])
+    assert len(t.flow_log) == 0
+
+
+def test_flow_log_append_unhappy_date(make_one, date):
+    """Ensure dates without a time are refused."""
+    t = make_one()
+    with pytest.raises(TypeError):
+        t.flow_log.append(dict(state="ND", entered_at=date.today()))
+
+
+def test_flow_log_trusted(make_one, days_ago):
+    """Ensure trusted entries skip validation but are still kept in order."""
+    t = make_one()
+    t.flow_log.extend([dict(state="NE", entered_at=days_ago(1)), dict(state="KS", entered_at=days_ago(3))], trusted=True)
+    t.flow_log.append(dict(state="IA", entered_at=days_ago(2)), trusted=True)
+    assert [fl['state'] for fl in t.flow_log] == ["KS", "IA", "NE"]
+
+
+def test_flow_entry_reads_like_a_dict(make_one, datetime):
+    """Ensure flow log entries are compact, immutable and still read like dicts."""
+    from agile_analytics.models import FlowEntry
+
+    when = datetime.now()
+    t = make_one()
+    t.flow_log.append(dict(entered_at=when, state="WY"))
+    entry = t.flow_log[0]
+
+    assert isinstance(entry, FlowEntry)
+    assert entry['state'] == entry.state == "WY"
+    assert entry['entered_at'] == entry.entered_at == when
+    assert entry == dict(entered_at=when, state="WY")
+    assert dict(entry) == dict(entered_at=when, state="WY")
+    assert not hasattr(entry, '__dict__')
+    with pytest.raises(KeyError):
+        entry['county']
+    with pytest.raises(TypeError):
+        entry['state'] = "MT"
+    with pytest.raises(AttributeError):
+        entry.state = "MT"
+
+
+def test_slotted(make_one):
+    """Ensure tickets only grow a __dict__ when given extra attributes."""
+    t = make_one()
+    assert 'key' in type(t).__slots__
+    assert t.__getstate__().get('points') is None
+    t.points = 3
+    assert t.points == 3
+
+
+def test_pickle(make_one, days_ago):
+    """Ensure tickets and their flow logs survive pickling, extra attributes included."""
+    import pickle
+
+    t = make_one(title="Pickled", ttype="Bug")
+    t.created_at = days_ago(3)
+    t.points = 5
+    t.flow_log.extend([dict(entered_at=days_ago(3), state="Created"), dict(entered_at=days_ago(1), state="Done")])
+
+    loaded = pickle.loads(pickle.dumps(t))
+    assert (loaded.key, loaded.title, loaded.type, loaded.created_at, loaded.points) == ("TEST-1", "Pickled", "Bug", days_ago(3), 5)
+    assert loaded.flow_log == t.flow_log
+    assert type(loaded.flow_log).__name__ == "FlowLog"
+
+
+def test_unpickle_dict_state(klass, days_ago):
+    """Ensure tickets pickled before they were slotted still load."""
+    from agile_analytics.models import FlowLog
+
+    t = klass.__new__(klass)
+    t.__setstate__(dict(key="TEST-9", title="Old", created_at=None, updated_at=None, type="Story", _flow_log=FlowLog([dict(entered_at=days_ago(1), state="Done")])))
+    assert t.key == "TEST-9"
+    assert t.flow_log[0]['state'] == "Done"
+
+
+def test_state_index(make_one, days_ago):
+    """Ensure the state index lists each state's entries in log order and follows changes to the log."""
+    from agile_analytics.symbols import STATES
+
+    t = make_one()
+    t.flow_log.extend([
+        dict(state="Open", entered_at=days_ago(9)),
+        dict(state="Doing", entered_at=days_ago(8)),
+        dict(state="Open", entered_at=days_ago(7)),
+    ])
+    index = t.state_index
+    assert [e.entered_at for e in index[STATES.find("Open")]] == [days_ago(9), days_ago(7)]
+    assert t.state_index is index
+
+    t.flow_log.append(dict(state="Open", entered_at=days_ago(8)))
+    assert [e.entered_at for e in t.state_index[STATES.find("Open")]] == [days_ago(9), days_ago(8), days_ago(7)]
+
+    t.flow_log.pop(0)
+    assert [e.entered_at for e in t.state_index[STATES.find("Open")]] == [days_ago(8), days_ago(7)]
+
+    t.flow_log[0] = t.flow_log[1]
+    assert STATES.find("Doing") not in t.state_index
+
+    t.flow_log.clear()
+    assert t.state_index == {}
+
+
+def test_flow_log_list_methods_store_entries(make_one, days_ago):
+    """Ensure dicts added through insert, item assignment and += are stored as FlowEntries the index can read."""
+    from agile_analytics.analyzers import DateAnalyzer
+    from agile_analytics.models import FlowEntry
+    from agile_analytics.symbols import STATES
+
+    t = make_one()
+    t.flow_log.extend([
+        dict(state="Open", entered_at=days_ago(9)),
+        dict(state="Doing", entered_at=days_ago(8)),
+    ])
+    t.state_index
+    t.flow_log.insert(2, dict(state="Done", entered_at=days_ago(7)))
+    assert [e.entered_at for e in t.state_index[STATES.find("Done")]] == [days_ago(7)]
+
+    t.flow_log[0] = dict(state="Open", entered_at=days_ago(10))
+    t.flow_log[1:2] = [dict(state="Doing", entered_at=days_ago(8))]
+    log = t.flow_log
+    log += [dict(state="Done", entered_at=days_ago(6))]
+    assert log is t.flow_log
+    assert all(type(e) is FlowEntry for e in t.flow_log)
+    assert [e.entered_at for e in t.state_index[STATES.find("Done")]] == [days_ago(7), days_ago(6)]
+
+    analyzed, ignored = DateAnalyzer(["Open"], ["Doing"], ["Done"]).analyze([t])
+    assert analyzed[0].ended['entered_at'] == days_ago(7)
+
+    with pytest.raises(TypeError):
+        t.flow_log.insert(0, "Done")
@@ -0,0 +1,257 @@
+"""Tests the asyncio JIRA fetcher against a local stub server."""
+
+import asyncio
+import random
+
+import pytest
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.async_fetchers import AsyncJIRAFetcher
+    return AsyncJIRAFetcher
+
+
+@pytest.fixture
+def raw_issues():
+    """Decoded search API JSON for a number of issues."""
+    def _raw_issues(count):
+        return [
+            {
+                "key": "FOO-{}".format(n),
+                "fields": {
+                    "summary": "Summary {}".format(n),
+                    "issuetype": {"name": "Story"},
+                    "created": "2016-03-30T17:27:09.000+0000",
+                    "updated": "2016-05-18T16:17:21.000+0000",
+                },
+                "changelog": {"histories": [
+                    {
+                        "created": "2016-04-27T14:21:23.000+0000",
+                        "items": [{"field": "status", "fromString": "Open", "toString": "In Progress"}],
+                    },
+                ]},
+            }
+            for n in range(1, count + 1)
+        ]
+    return _raw_issues
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a fresh event loop."""
+    def _run(coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    return _run
+
+
+@pytest.fixture
+def stub_server(raw_issues):
+    """Start a local JIRA search API stub that answers with some latency."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    def _stub_server(count, latency=0.02, changelogs=None, throttle=0):
+        issues = raw_issues(count)
+        changelogs = changelogs or {}
+        stats = dict(requests=[], in_flight=0, max_in_flight=0, changelog_requests=[], throttled=0)
+        for issue in issues:
+            histories = changelogs.get(issue['key'])
+            if histories:
+                issue['changelog'] = dict(startAt=0, maxResults=100, total=len(histories), histories=histories[:100])
+
+        async def search(request):
+            if stats['throttled'] < throttle:
+                stats['throttled'] += 1
+                return web.json_response(dict(errorMessages=["Rate limit exceeded"]), status=429, headers={'Retry-After': '0'})
+            start_at = int(request.query['startAt'])
+            max_results = int(request.query['maxResults'])
+            stats['requests'].append(dict(request.query, authorization=request.headers.get('Authorization')))
+            stats['in_flight'] += 1
+            stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+            await asyncio.sleep(latency * random.random())
+            stats['in_flight'] -= 1
+            return web.json_response(dict(
+                startAt=start_at,
+                maxResults=max_results,
+                total=len(issues),
+                issues=issues[start_at:start_at + max_results],
+            ))
+
+        async def changelog(request):
+            key = request.match_info['key']
+            start_at = int(request.query['startAt'])
+            stats['changelog_requests'].append((key, start_at))
+            await asyncio.sleep(latency * random.random())
+            values = changelogs[key][start_at:start_at + int(request.query['maxResults'])]
+            return web.json_response(dict(startAt=start_at, total=len(changelogs[key]), values=values))
+
+        app = web.Application()
+        app.router.add_get('/rest/api/2/search', search)
+        app.router.add_get('/rest/api/2/issue/{key}/changelog', changelog)
+        return TestServer(app), stats
+    return _stub_server
+
+
+def test_oauth_unsupported(klass):
+    """Only basic auth is supported."""
+    with pytest.raises(TypeError):
+        klass(
+            url="https://jira.example.local",
+            auth=dict(access_token="foo", access_token_secret="bar", consumer_key="baz", key_cert="cert"),
+            filter_id=9999,
+        )
+
+
+def test_fetch(klass, stub_server, run, raw_issues):
+    """Ensure every page is fetched concurrently and converted in order."""
+    from agile_analytics.fetchers import convert_jira_json
+
+    server, stats = stub_server(95)
+
+    async def fetch():
+        async with server:
+            f = klass(
+                url=str(server.make_url('/')),
+                auth=dict(username="foo", password="bar"),
+                filter_id=9999,
+                page_size=10,
+                concurrency=4,
+            )
+            return await f.fetch()
+
+    tickets = run(fetch())
+    expected = [convert_jira_json(i) for i in raw_issues(95)]
+    assert [t.key for t in tickets] == [t.key for t in expected]
+    assert tickets[0].flow_log == expected[0].flow_log
+    assert stats['requests'][0]['jql'] == "filter=9999"
+    assert stats['requests'][0]['authorization'] == "Basic Zm9vOmJhcg=="
+    assert stats['requests'][0]['fields'] == "summary,created,updated,issuetype"
+    assert 1 < stats['max_in_flight'] <= 4
+
+
+def test_stream_many_filters(klass, stub_server, run):
+    """Ensure several fetchers can share one session and one request limit."""
+    import aiohttp
+
+    server, stats = stub_server(25)
+
+    async def fetch():
+        async with server:
+            semaphore = asyncio.Semaphore(3)
+            fetchers = [
+                klass(
+                    url=str(server.make_url('/')),
+                    auth=dict(username="foo", password="bar"),
+                    filter_id=filter_id,
+                    page_size=5,
+                    semaphore=semaphore,
+                )
+                for filter_id in (1, 2, 3)
+            ]
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*[f.fetch(session=session) for f in fetchers])
+        return results
+
+    results = run(fetch())
+    assert [len(tickets) for tickets in results] == [25, 25, 25]
+    assert stats['max_in_flight'] <= 3
+
+
+def test_stream_early_exit(klass, stub_server, run):
+    """Ensure leaving a stream early doesn't leave requests behind."""
+    server, stats = stub_server(95)
+
+    async def first_ticket():
+        async with server:
+            f = klass(
+                url=str(server.make_url('/')),
+                auth=dict(username="foo", password="bar"),
+                filter_id=9999,
+                page_size=10,
+            )
+            async with f.stream() as stream:
+                async for ticket in stream:
+                    return ticket
+
+    assert run(first_ticket()).key == "FOO-1"
+
+
+def test_fetch_many_filters(klass, stub_server, run):
+    """Ensure several filters share one combined search and record their matches."""
+    server, stats = stub_server(3)
+
+    async def fetch():
+        async with server:
+            f = klass(
+                url=str(server.make_url('/')),
+                auth=dict(username="foo", password="bar"),
+                filter_id=[1, 2],
+            )
+            return await f.fetch()
+
+    tickets = run(fetch())
+    assert [t.matched_filters for t in tickets] == [[1, 2]] * 3
+    assert [r['jql'] for r in stats['requests'] if 'expand' in r] == ["(filter=1) OR (filter=2)"]
+
+
+def test_fetch_truncated_changelogs(klass, stub_server, run):
+    """Ensure truncated changelogs are completed with concurrent changelog requests."""
+    histories = [
+        {
+            "created": "2016-04-{:02d}T14:21:23.000+0000".format(1 + n // 10),
+            "items": [{"field": "status", "fromString": "A", "toString": "State {}".format(n)}],
+        }
+        for n in range(250)
+    ]
+    server, stats = stub_server(3, changelogs={"FOO-1": histories, "FOO-3": histories[:150]})
+
+    async def fetch():
+        async with server:
+            f = klass(
+                url=str(server.make_url('/')),
+                auth=dict(username="foo", password="bar"),
+                filter_id=9999,
+            )
+            return await f.fetch()
+
+    tickets = run(fetch())
+    assert [len(t.flow_log) for t in tickets] == [251, 2, 151]
+    assert sorted(stats['changelog_requests']) == [("FOO-1", 100), ("FOO-1", 200), ("FOO-3", 100)]
+
+
+def test_fetch_throttled(klass, stub_server, run):
+    """Ensure throttled requests are retried after Retry-After instead of raising."""
+    from agile_analytics.throttling import RateController
+
+    server, stats = stub_server(25, throttle=3)
+    controller = RateController(max_concurrency=4)
+
+    async def fetch():
+        async with server:
+            f = klass(
+                url=str(server.make_url('/')),
+                auth=dict(username="foo", password="bar"),
+                filter_id=9999,
+                page_size=10,
+                rate_controller=controller,
+            )
+            return await f.fetch()
+
+    assert len(run(fetch())) == 25
+    assert stats['throttled'] == 3
+    assert controller.retries == 3
+
+
+def test_not_a_jira_fetcher(klass):
+    """Ensure code holding a JIRAFetcher never gets a coroutine from fetch()."""
+    from agile_analytics.fetchers import BaseJIRAFetcher, JIRAFetcher
+
+    f = klass(url="https://jira.example.local", auth=dict(username="foo", password="bar"), filter_id=9999)
+    assert isinstance(f, BaseJIRAFetcher)
+    assert not isinstance(f, JIRAFetcher)
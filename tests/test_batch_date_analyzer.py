@@ -0,0 +1,32 @@
+"""Test the NumPy batch Cycle Date analyzer against the plain one."""
+
+import pytest
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.analyzers import BatchDateAnalyzer
+    return BatchDateAnalyzer
+
+
+@pytest.mark.parametrize("strategy", [None, "oldest", "newest"])
+def test_matches_date_analyzer(klass, random_tickets, summary, strategy):
+    """Batch analysis gives the same analyzed and ignored tickets as DateAnalyzer."""
+    from agile_analytics.analyzers import DateAnalyzer
+
+    states = dict(
+        commit_states=[u"Selected", u"To Do", u"Created"],
+        start_states=[u"Dev In Progress", u"In Progress", u"Never Seen"],
+        end_states=[u"Done", u"Accepted"],
+    )
+    expected = DateAnalyzer(**states).analyze(random_tickets, strategy=strategy)
+    actual = klass(**states).analyze(random_tickets, strategy=strategy)
+    assert len(expected[0]) > 0 and len(expected[1]) > 0
+    assert summary(*actual) == summary(*expected)
+
+
+def test_empty(klass):
+    """Nothing to analyze gives nothing back."""
+    analyzer = klass(commit_states=["Selected"], start_states=["In Progress"], end_states=["Done"])
+    assert analyzer.analyze([]) == ([], [])
@@ -0,0 +1,131 @@
+"""Test caching analysis outcomes."""
+
+import pytest
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.caches import AnalysisCache
+    return AnalysisCache
+
+
+@pytest.fixture
+def analyzer():
+    """Return a DateAnalyzer with some defaults."""
+    from agile_analytics.analyzers import DateAnalyzer
+    return DateAnalyzer(
+        commit_states=["Selected", "Created"],
+        start_states=["In Progress"],
+        end_states=["Done"],
+    )
+
+
+@pytest.fixture
+def tickets(Ticket, days_ago):
+    """Return a finished ticket, an unfinished one and one never updated."""
+    return [
+        Ticket(key="TEST-1", updated_at=days_ago(1), flow_logs=[
+            dict(entered_at=days_ago(5), state="Created"),
+            dict(entered_at=days_ago(4), state="In Progress"),
+            dict(entered_at=days_ago(1), state="Done"),
+        ]),
+        Ticket(key="TEST-2", updated_at=days_ago(2), flow_logs=[
+            dict(entered_at=days_ago(5), state="Created"),
+        ]),
+        Ticket(key="TEST-3", updated_at=None, flow_logs=[
+            dict(entered_at=days_ago(5), state="Created"),
+            dict(entered_at=days_ago(4), state="In Progress"),
+            dict(entered_at=days_ago(3), state="Done"),
+        ]),
+    ]
+
+
+def test_unchanged_tickets_are_reused(klass, analyzer, tickets, summary):
+    """Tickets analyzed before come back from the cache, ignored ones included."""
+    cache = klass()
+    first = analyzer.analyze(tickets, cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+
+    second = analyzer.analyze(tickets, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert second[0][0] is first[0][0]
+    assert second[1][0]['ticket'] is tickets[1]
+    assert second[1][0]['state_list'] is analyzer.start_states
+    assert summary(*second) == summary(*first) == summary(*analyzer.analyze(tickets))
+
+
+def test_updated_tickets_are_analyzed_again(klass, analyzer, tickets, days_ago):
+    """A ticket with a new updated_at misses the cache."""
+    cache = klass()
+    analyzer.analyze(tickets, cache=cache)
+
+    tickets[1].flow_log.extend([dict(entered_at=days_ago(1), state="In Progress"), dict(entered_at=days_ago(0), state="Done")])
+    tickets[1].updated_at = days_ago(0)
+    analyzed, ignored = analyzer.analyze(tickets, cache=cache)
+    assert [a.key for a in analyzed] == ["TEST-1", "TEST-2", "TEST-3"]
+    assert ignored == []
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+
+    analyzer.analyze(tickets, cache=cache)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_context_and_strategy_are_part_of_the_key(klass, analyzer, tickets):
+    """Analyzing with other states, another strategy or another class doesn't reuse outcomes."""
+    from agile_analytics.analyzers import DateAnalyzer, PartialDateAnalyzer
+
+    cache = klass()
+    analyzer.analyze(tickets, cache=cache)
+    analyzer.analyze(tickets, strategy=analyzer.NEWEST_DATE, cache=cache)
+    DateAnalyzer(["Created"], ["In Progress"], ["Done"]).analyze(tickets, cache=cache)
+    PartialDateAnalyzer(analyzer.commit_states, analyzer.start_states, analyzer.end_states).analyze(tickets, cache=cache)
+    assert cache.hits == 0
+
+    analyzer.analyze(tickets, strategy=analyzer.OLDEST_DATE, cache=cache)
+    assert cache.hits == 2
+
+
+def test_lru(klass, analyzer, tickets):
+    """Only the most recently used outcomes are kept in memory."""
+    cache = klass(maxsize=1)
+    analyzer.analyze(tickets, cache=cache)
+    assert len(cache) == 1
+    analyzer.analyze(tickets, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_shelve(klass, analyzer, tickets, tmpdir, days_ago, summary):
+    """Outcomes saved to disk are reused by the next run, a ticket's new version replacing its old one."""
+    filename = str(tmpdir.join("analysis"))
+    with klass(filename=filename) as cache:
+        expected = analyzer.analyze(tickets, cache=cache)
+
+    with klass(filename=filename) as cache:
+        actual = analyzer.analyze(tickets, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (2, 0, 2)
+    assert summary(*actual) == summary(*expected)
+
+    tickets[0].updated_at = days_ago(0)
+    with klass(filename=filename) as cache:
+        analyzer.analyze(tickets, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 2)
+
+    with klass(filename=filename) as cache:
+        analyzer.analyze(tickets, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (2, 0, 2)
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_batch_analyzer(klass, random_tickets, days_ago, summary):
+    """Cached batch analysis gives the same results as analyzing every ticket."""
+    from agile_analytics.analyzers import BatchDateAnalyzer
+
+    analyzer = BatchDateAnalyzer(["Selected", "To Do"], ["In Progress"], ["Done"])
+    cache = klass()
+    analyzer.analyze(random_tickets[:120], cache=cache)
+    for t in random_tickets[::7]:
+        t.updated_at = days_ago(-1)
+    actual = analyzer.analyze(random_tickets, cache=cache)
+    assert summary(*actual) == summary(*analyzer.analyze(random_tickets))
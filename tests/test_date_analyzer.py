@@ -220,3 +220,28 @@ def test_capturing_title(klass, Ticket, days_ago):
     results, ignored_issues = analyzer.analyze([t, ])
     at = results[0]
     assert at.title == "This is my test title"
+
+
+def test_ticket_changed_after_analysis(analyzer, Ticket, days_ago):
+    """Changing a ticket's flow log after analyzing it is picked up by the next analysis."""
+    t = Ticket(
+        key="TEST-1",
+        created_at=days_ago(15),
+        updated_at=days_ago(0),
+        flow_logs=[
+            dict(entered_at=days_ago(10), state="Selected"),
+            dict(entered_at=days_ago(9), state="In Progress"),
+            dict(entered_at=days_ago(2), state="Done"),
+        ]
+    )
+    results, _ = analyzer.analyze([t, ])
+    assert results[0].started['entered_at'] == days_ago(9)
+
+    t.flow_log.append(dict(entered_at=days_ago(9.5), state="In Progress"))
+    results, _ = analyzer.analyze([t, ])
+    assert results[0].started['entered_at'] == days_ago(9.5)
+
+    del t.flow_log[-1]
+    results, ignored = analyzer.analyze([t, ])
+    assert results == []
+    assert ignored[0]['phase'] == "ended"
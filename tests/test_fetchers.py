@@ -191,6 +191,15 @@ def test_extra_kwargs(klass):
         assert f.jira_kwargs[key] == value
 
 
+def test_positional_kwargs(klass):
+    """Ensure max_results and jira_kwargs keep their original positions."""
+    extra_kwargs = dict(options=dict(verify=False))
+    f = klass("https://jira.example.local", dict(username="foo", password="bar"), 9999, 50, extra_kwargs)
+    assert f._max_results == 50
+    assert f.jira_kwargs['options'] == extra_kwargs['options']
+    assert f._page_size == 100
+
+
 def test_fetch(klass, JIRA):
     """Ensure the JIRAFetcher fetch method returns issues."""
     basic_auth = dict(username="foo", password="bar")
@@ -284,3 +293,670 @@ def test_ticket_type_default(jira_issue, converter, tz):
     del jira_issue.fields.issuetype
     t = converter(jira_issue)
     assert t.type == "Ticket"
+
+
+class ResultList(list):
+    """A list of search results that knows the total number of matches, like jira.client.ResultList."""
+
+    def __init__(self, iterable=None, total=None):
+        super(ResultList, self).__init__(iterable or [])
+        self.total = total
+
+
+@pytest.fixture
+def make_issues(jira_issue):
+    """Make a number of uniquely keyed jira issues."""
+    def _make_issues(count):
+        return [
+            stub(key="FOO-{}".format(n), fields=jira_issue.fields, changelog=jira_issue.changelog)
+            for n in range(1, count + 1)
+        ]
+    return _make_issues
+
+
+@pytest.fixture
+def PagingJIRA(make_issues):
+    """Fake JIRA instance that pages through a result set."""
+    def _PagingJIRA(count):
+        issues = make_issues(count)
+
+        class MockPagingJIRA(object):
+            calls = []
+
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def search_issues(self, jql, startAt=0, maxResults=50, **kwargs):
+                self.calls.append(dict(startAt=startAt, maxResults=maxResults))
+                return ResultList(issues[startAt:startAt + maxResults], total=len(issues))
+        return MockPagingJIRA
+    return _PagingJIRA
+
+
+def test_fetch_pages(klass, PagingJIRA):
+    """Ensure fetch walks through every page of results."""
+    JIRA = PagingJIRA(25)
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        page_size=10,
+    )
+    tickets = f.fetch(jira_klass=JIRA)
+    assert [t.key for t in tickets] == ["FOO-{}".format(n) for n in range(1, 26)]
+    assert [c['startAt'] for c in JIRA.calls] == [0, 10, 20]
+
+
+def test_fetch_max_results(klass, PagingJIRA):
+    """Ensure max_results caps the number of tickets fetched."""
+    JIRA = PagingJIRA(25)
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        max_results=15,
+        page_size=10,
+    )
+    tickets = f.fetch(jira_klass=JIRA)
+    assert len(tickets) == 15
+    assert JIRA.calls[-1] == dict(startAt=10, maxResults=5)
+
+
+def test_iter_fetch_is_lazy(klass, PagingJIRA):
+    """Ensure the first ticket is available after a single search call."""
+    JIRA = PagingJIRA(25)
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        page_size=10,
+    )
+    tickets = f.iter_fetch(jira_klass=JIRA)
+    assert next(tickets).key == "FOO-1"
+    assert len(JIRA.calls) == 1
+
+
+def test_fetch_concurrently(klass, jira_server):
+    """Ensure pages fetched in parallel from a slow server overlap and come back in filter order."""
+    from jira import JIRA
+
+    url, stats = jira_server(95, latency=0.05)
+
+    def fetch(concurrency):
+        f = klass(
+            url=url,
+            auth=dict(username="foo", password="bar"),
+            filter_id=9999,
+            page_size=10,
+            concurrency=concurrency,
+        )
+        with f:
+            return f.fetch(jira_klass=JIRA)
+
+    serial = fetch(1)
+    assert stats['max_in_flight'] == 1
+    tickets = fetch(4)
+    assert [t.key for t in tickets] == [t.key for t in serial] == ["FOO-{}".format(n) for n in range(1, 96)]
+    assert 1 < stats['max_in_flight'] <= 4
+
+
+def test_fetch_concurrently_max_results(klass, jira_server):
+    """Ensure max_results is honored when fetching in parallel."""
+    from jira import JIRA
+
+    url, stats = jira_server(95, latency=0.02)
+    f = klass(
+        url=url,
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        max_results=42,
+        page_size=10,
+        concurrency=4,
+    )
+    tickets = f.fetch(jira_klass=JIRA)
+    assert [t.key for t in tickets] == ["FOO-{}".format(n) for n in range(1, 43)]
+    assert sum(int(search['maxResults']) for search in stats['searches']) == 42
+
+
+def test_fetch_incremental(klass, make_issues, tmpdir, tz):
+    """Ensure incremental fetches only ask for tickets updated since the watermark."""
+    from agile_analytics.stores import ShelveTicketStore
+
+    searches = []
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql, **kwargs):
+            searches.append(jql)
+            return make_issues(2)
+
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+    )
+    with ShelveTicketStore(str(tmpdir.join("tickets"))) as store:
+        f.fetch_incremental(store, jira_klass=MockJIRA)
+        assert searches[-1] == "filter=9999"
+        assert store.watermark == datetime(2016, 5, 18, 16, 17, 21, tzinfo=tz)
+        assert len(store) == 2
+
+        f.fetch_incremental(store, jira_klass=MockJIRA)
+        assert searches[-1] == 'filter=9999 AND updated >= "2016/05/17 16:17"'
+        assert len(store) == 2
+
+
+@pytest.mark.parametrize("fields,expected", [
+    (None, ['summary', 'created', 'updated', 'issuetype']),
+    (['customfield_10002', 'summary'], ['summary', 'created', 'updated', 'issuetype', 'customfield_10002']),
+])
+def test_fetch_fields(klass, jira_issue, fields, expected):
+    """Ensure searches only ask for the fields that are needed."""
+    searches = []
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql, **kwargs):
+            searches.append(kwargs)
+            return [jira_issue, ]
+
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        fields=fields,
+    )
+    f.fetch(jira_klass=MockJIRA)
+    assert searches[0]['fields'] == expected
+    assert searches[0]['expand'] == "changelog"
+
+
+@pytest.mark.parametrize("value", [
+    "2016-03-30T17:27:09.000+0000",
+    "2016-03-30T17:27:09.123-0500",
+    "2016-12-31T23:59:59.999+0530",
+    "2016-03-30T17:27:09+0000",
+    "2016-03-30 17:27:09",
+])
+def test_parse_jira_datetime(value):
+    """Ensure the fast path returns exactly what dateutil would."""
+    from dateutil.parser import parse
+    from agile_analytics.fetchers import parse_jira_datetime
+
+    parsed = parse_jira_datetime(value)
+    expected = parse(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_jira_datetime_invalid():
+    """Ensure garbage still raises like dateutil does."""
+    from agile_analytics.fetchers import parse_jira_datetime
+    with pytest.raises(ValueError):
+        parse_jira_datetime("2016-13-30T17:27:09.000+0000")
+
+
+@pytest.fixture
+def jira_json(jira_issue):
+    """Decoded search API JSON for the same issue as jira_issue."""
+    return {
+        "key": jira_issue.key,
+        "fields": {
+            "summary": jira_issue.fields.summary,
+            "issuetype": {"name": jira_issue.fields.issuetype.name},
+            "created": jira_issue.fields.created,
+            "updated": jira_issue.fields.updated,
+        },
+        "changelog": {
+            "startAt": 0,
+            "maxResults": len(jira_issue.changelog.histories),
+            "total": len(jira_issue.changelog.histories),
+            "histories": [
+                {
+                    "created": history.created,
+                    "items": [
+                        {"field": item.field, "fromString": item.fromString, "toString": item.toString}
+                        for item in history.items
+                    ],
+                }
+                for history in jira_issue.changelog.histories
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def jira_server(jira_json):
+    """Start a local JIRA REST API stub a real jira.JIRA client can search.
+
+    Each search takes up to `latency` seconds. Searches are throttled with 429
+    and a Retry-After header until `throttle` of them have been turned away.
+    """
+    import json
+    import random
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+
+    servers = []
+
+    class Server(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    def _jira_server(count, latency=0, throttle=0, retry_after="2"):
+        issues = [dict(jira_json, key="FOO-{}".format(n)) for n in range(1, count + 1)]
+        stats = dict(searches=[], throttled=0, in_flight=0, max_in_flight=0)
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                if url.path == "/rest/api/2/serverInfo":
+                    return self.reply(dict(version="9.4.0", versionNumbers=[9, 4, 0], deploymentType="Server"))
+                if url.path == "/rest/api/2/field":
+                    return self.reply([dict(id=f, name=f, custom=False, clauseNames=[f]) for f in jira_json['fields']])
+                if url.path == "/rest/api/2/search":
+                    with lock:
+                        throttled = stats['throttled'] < throttle
+                        if throttled:
+                            stats['throttled'] += 1
+                        else:
+                            stats['searches'].append(query)
+                            stats['in_flight'] += 1
+                            stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+                    if throttled:
+                        return self.reply(dict(errorMessages=["Rate limit exceeded"]), status=429, headers={'Retry-After': retry_after})
+                    time.sleep(latency * random.uniform(0.5, 1))
+                    with lock:
+                        stats['in_flight'] -= 1
+                    start_at, max_results = int(query['startAt']), int(query['maxResults'])
+                    return self.reply(dict(startAt=start_at, maxResults=max_results, total=len(issues), issues=issues[start_at:start_at + max_results]))
+                self.reply(dict(errorMessages=["Not found"]), status=404)
+
+            def reply(self, body, status=200, headers=None):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        server = Server(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, kwargs=dict(poll_interval=0.05), daemon=True).start()
+        servers.append(server)
+        return "http://127.0.0.1:{}".format(server.server_port), stats
+
+    yield _jira_server
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_json_converter_matches(jira_issue, jira_json, converter):
+    """Ensure the JSON converter builds the same ticket as the Issue converter."""
+    from agile_analytics.fetchers import convert_jira_json
+    expected = converter(jira_issue)
+    t = convert_jira_json(jira_json)
+    assert (t.key, t.title, t.type) == (expected.key, expected.title, expected.type)
+    assert (t.created_at, t.updated_at) == (expected.created_at, expected.updated_at)
+    assert t.flow_log == expected.flow_log
+
+
+def test_json_converter_type_default(jira_json):
+    """The type of ticket should be Ticket if issuetype can't be found."""
+    from agile_analytics.fetchers import convert_jira_json
+    del jira_json['fields']['issuetype']
+    assert convert_jira_json(jira_json).type == "Ticket"
+
+
+def test_fetch_raw(klass, jira_json):
+    """Ensure raw fetches ask for and convert the search JSON."""
+    searches = []
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql, **kwargs):
+            searches.append(kwargs)
+            return dict(startAt=0, maxResults=100, total=1, issues=[jira_json])
+
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        raw=True,
+    )
+    tickets = f.fetch(jira_klass=MockJIRA)
+    assert searches[0]['json_result'] is True
+    assert tickets[0].key == "FOO-1"
+    assert len(tickets[0].flow_log) == 7
+
+
+@pytest.fixture
+def FilterJIRA(make_issues):
+    """Fake JIRA instance that knows which issues each filter matches."""
+    import re
+
+    def _FilterJIRA(filters):
+        issues = {i.key: i for i in make_issues(10)}
+
+        class MockFilterJIRA(object):
+            searches = []
+
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def search_issues(self, jql, startAt=0, maxResults=50, **kwargs):
+                self.searches.append(dict(kwargs, jql=jql))
+                keys = set()
+                for filter_id in re.findall(r"filter=(\d+)", jql):
+                    keys.update(filters[int(filter_id)])
+                matched = [issues[k] for k in sorted(keys, key=lambda k: int(k.split("-")[1]))]
+                return ResultList(matched[startAt:startAt + maxResults], total=len(matched))
+        return MockFilterJIRA
+    return _FilterJIRA
+
+
+def test_fetch_many_filters(klass, FilterJIRA):
+    """Ensure overlapping filters are fetched once and tickets know which filters matched."""
+    JIRA = FilterJIRA({1: ["FOO-1", "FOO-2", "FOO-3"], 2: ["FOO-3", "FOO-4"]})
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=[1, 2],
+        concurrency=2,
+    )
+    tickets = f.fetch(jira_klass=JIRA)
+    assert [t.key for t in tickets] == ["FOO-1", "FOO-2", "FOO-3", "FOO-4"]
+    assert [t.matched_filters for t in tickets] == [[1], [1], [1, 2], [2]]
+
+    full_searches = [s for s in JIRA.searches if s['expand'] == "changelog"]
+    assert [s['jql'] for s in full_searches] == ["(filter=1) OR (filter=2)"]
+    key_searches = [s for s in JIRA.searches if s['expand'] is None]
+    assert sorted(s['jql'] for s in key_searches) == ["filter=1", "filter=2"]
+    assert all(s['fields'] == ['key'] for s in key_searches)
+
+
+def test_fetch_single_filter_matches(klass, JIRA):
+    """A single filter matches every ticket without any extra searches."""
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+    )
+    assert f.fetch(jira_klass=JIRA)[0].matched_filters == [9999]
+
+
+@pytest.mark.parametrize("filter_id,since,expected", [
+    ("9999", None, "filter=9999"),
+    ("project = FOO ORDER BY key", None, "project = FOO ORDER BY key"),
+    ("project = FOO order by key", datetime(2016, 5, 18, 16, 17), '(project = FOO) AND updated >= "2016/05/17 16:17" ORDER BY key'),
+    ([1, "project = FOO ORDER BY key"], None, "(filter=1) OR (project = FOO) ORDER BY key"),
+    ([1, 2], datetime(2016, 5, 18, 16, 17), '((filter=1) OR (filter=2)) AND updated >= "2016/05/17 16:17"'),
+])
+def test_search_string(klass, filter_id, since, expected):
+    """Ensure filters and raw JQL are combined into one valid search."""
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=filter_id,
+    )
+    assert f._search_string(since) == expected
+
+
+@pytest.mark.parametrize("offset_hours", [-10, 0, 5.5, 10, 14])
+def test_search_string_non_utc_watermark(klass, offset_hours):
+    """Ensure the search window starts at or before the watermark in whatever timezone JIRA reads it."""
+    from datetime import timedelta
+    from dateutil.tz import tzoffset
+
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+    )
+    watermark = datetime(2016, 5, 18, 1, 30, tzinfo=tzoffset(None, int(offset_hours * 3600)))
+    literal = f._search_string(watermark).split('"')[1]
+    for jira_hours in range(-12, 15):
+        start = datetime.strptime(literal, f.JQL_DATE_FORMAT).replace(tzinfo=tzoffset(None, jira_hours * 3600))
+        assert start <= watermark
+        assert watermark - start <= timedelta(days=2)
+
+
+def test_merge_tickets(Ticket, days_ago):
+    """Ensure duplicates collapse to the newest version in first seen order."""
+    from agile_analytics.fetchers import merge_tickets
+    tickets = [
+        Ticket(key="FOO-1", title="Old", updated_at=days_ago(5), flow_logs=[]),
+        Ticket(key="FOO-2", title="Only", updated_at=days_ago(5), flow_logs=[]),
+        Ticket(key="FOO-1", title="New", updated_at=days_ago(1), flow_logs=[]),
+        Ticket(key="FOO-1", title="Stale", updated_at=days_ago(3), flow_logs=[]),
+    ]
+    assert [(t.key, t.title) for t in merge_tickets(tickets)] == [("FOO-1", "New"), ("FOO-2", "Only")]
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_fetch_throttled(klass, jira_server, raw):
+    """Ensure searches a real client sees throttled are retried after Retry-After instead of losing the fetch."""
+    from jira import JIRA
+    from agile_analytics.throttling import RateController
+
+    url, stats = jira_server(30, throttle=3)
+    sleeps = []
+    f = klass(
+        url=url,
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        page_size=10,
+        concurrency=2,
+        raw=raw,
+        rate_controller=RateController(max_concurrency=2, sleep=sleeps.append),
+    )
+    tickets = f.fetch(jira_klass=JIRA)
+    assert [t.key for t in tickets] == ["FOO-{}".format(n) for n in range(1, 31)]
+    assert stats['throttled'] == 3
+    assert sleeps == [2.0, 2.0, 2.0]
+    assert f.rate_controller.retries == 3
+    assert f.rate_controller.throttled_seconds == 6.0
+
+    unthrottled = klass(url=jira_server(30)[0], auth=dict(username="foo", password="bar"), filter_id=9999, page_size=10, raw=raw)
+    unthrottled.fetch(jira_klass=JIRA)
+    assert [p.response_bytes for p in f.stats.pages] == [p.response_bytes for p in unthrottled.stats.pages]
+
+
+@pytest.fixture
+def long_changelog_json(jira_json):
+    """Decoded search API JSON for an issue with a truncated changelog, and the full history."""
+    from datetime import timedelta
+    start = datetime(2016, 4, 1)
+    histories = [
+        {
+            "id": str(n),
+            "created": "{:%Y-%m-%dT%H:%M:%S}.000+0000".format(start + timedelta(hours=n)),
+            "items": [{"field": "status", "fromString": "A", "toString": "State {}".format(n)}],
+        }
+        for n in range(250)
+    ]
+    jira_json['changelog'] = dict(startAt=100, maxResults=100, total=250, histories=histories[100:200])
+    return jira_json, histories
+
+
+@pytest.fixture
+def ChangelogJIRA(long_changelog_json):
+    """Fake JIRA instance serving an issue whose changelog JIRA truncated."""
+    raw, histories = long_changelog_json
+
+    class MockChangelogJIRA(object):
+        changelog_requests = []
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql, json_result=False, **kwargs):
+            if json_result:
+                return dict(startAt=0, maxResults=100, total=1, issues=[raw])
+            return ResultList([stub(key=raw['key'], raw=raw)], total=1)
+
+        def _get_json(self, path, params=None):
+            self.changelog_requests.append((path, params['startAt']))
+            start_at = params['startAt']
+            return dict(startAt=start_at, total=len(histories), values=histories[start_at:start_at + params['maxResults']])
+    return MockChangelogJIRA
+
+
+@pytest.mark.parametrize("raw", [True, False])
+def test_fetch_truncated_changelog(klass, ChangelogJIRA, raw):
+    """Ensure changelogs JIRA truncated are completed from the changelog endpoint."""
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        concurrency=2,
+        raw=raw,
+    )
+    ticket = f.fetch(jira_klass=ChangelogJIRA)[0]
+    assert [entry['state'] for entry in ticket.flow_log] == ["Created"] + ["State {}".format(n) for n in range(250)]
+    assert sorted(ChangelogJIRA.changelog_requests) == [("issue/FOO-1/changelog", 0), ("issue/FOO-1/changelog", 200)]
+
+
+def test_record_and_replay(klass, make_issues, jira_json, tmpdir):
+    """Ensure recorded pages replay into the same tickets without a JIRA connection."""
+    from agile_analytics.fetchers import ReplayFetcher
+
+    issues = []
+    for n in range(1, 26):
+        i = dict(jira_json, key="FOO-{}".format(n))
+        issues.append(i)
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql, startAt=0, maxResults=50, json_result=False, **kwargs):
+            return dict(startAt=startAt, maxResults=maxResults, total=len(issues), issues=issues[startAt:startAt + maxResults])
+
+    directory = str(tmpdir.join("recording"))
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        page_size=10,
+        raw=True,
+        record_to=directory,
+    )
+    fetched = f.fetch(jira_klass=MockJIRA)
+
+    replay = ReplayFetcher(directory)
+    assert len(replay.pages) == 3
+    replayed = replay.fetch()
+    assert [t.key for t in replayed] == [t.key for t in fetched]
+    assert [t.flow_log for t in replayed] == [t.flow_log for t in fetched]
+
+    del issues[10:]
+    refetched = f.fetch(jira_klass=MockJIRA)
+    assert len(replay.pages) == 1
+    assert [t.key for t in replay.fetch()] == [t.key for t in refetched]
+
+
+def test_fetch_reuses_client(klass, make_issues):
+    """Ensure repeated fetches share one client and its pooled, kept-alive connections."""
+    import requests
+
+    created = []
+    closed = []
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            self._session = requests.Session()
+            created.append(self)
+
+        def search_issues(self, jql, **kwargs):
+            return make_issues(2)
+
+        def close(self):
+            closed.append(self)
+
+    with klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        concurrency=25,
+    ) as f:
+        f.fetch(jira_klass=MockJIRA)
+        f.fetch(jira_klass=MockJIRA)
+        assert len(created) == 1
+        assert f.client(MockJIRA) is created[0]
+        assert created[0]._session.get_adapter("https://jira.example.local")._pool_maxsize == 25
+    assert closed == created
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_fetch_stats(klass, PagingJIRA, concurrency):
+    """Ensure every page's latency, size and conversion time are recorded and reported."""
+    reported = []
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+        page_size=10,
+        concurrency=concurrency,
+        on_page=reported.append,
+    )
+    f.fetch(jira_klass=PagingJIRA(25))
+
+    assert reported == f.stats.pages
+    assert [p.number for p in f.stats.pages] == [0, 1, 2]
+    assert [p.start_at for p in f.stats.pages] == [0, 10, 20]
+    assert [p.issues for p in f.stats.pages] == [10, 10, 5]
+    assert f.stats.issues == 25
+    assert f.stats.response_bytes is None
+    assert all(p.request_seconds >= 0 and p.convert_seconds >= 0 for p in f.stats.pages)
+    assert f.stats.elapsed >= f.stats.convert_seconds
+    assert f.stats.issues_per_second > 0
+
+
+def test_fetch_stats_response_bytes(klass, make_issues):
+    """Ensure response sizes and arrival are noted through the client's HTTP session, leaving out throttled responses."""
+    import time
+
+    import requests
+    from requests.hooks import dispatch_hook
+
+    class MockJIRA(object):
+        def __init__(self, *args, **kwargs):
+            self._session = requests.Session()
+
+        def search_issues(self, jql, **kwargs):
+            throttled = requests.Response()
+            throttled.status_code = 429
+            throttled._content = b"x" * 99
+            dispatch_hook('response', self._session.hooks, throttled)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"x" * 1234
+            dispatch_hook('response', self._session.hooks, response)
+            time.sleep(0.05)
+            return make_issues(2)
+
+    f = klass(
+        url="https://jira.example.local",
+        auth=dict(username="foo", password="bar"),
+        filter_id=9999,
+    )
+    f.fetch(jira_klass=MockJIRA)
+    assert f.stats.pages[0].response_bytes == 1234
+    assert f.stats.response_bytes == 1234
+    assert f.stats.pages[0].decode_seconds >= 0.05 > f.stats.pages[0].request_seconds
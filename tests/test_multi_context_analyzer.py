@@ -0,0 +1,48 @@
+"""Test analyzing several contexts at once against a DateAnalyzer per context."""
+
+import pytest
+
+
+CONTEXTS = dict(
+    cycle=([u"Selected", u"To Do", u"Created"], [u"Dev In Progress", u"In Progress"], [u"Done", u"Accepted"]),
+    analysis=([u"Created"], [u"To Do", u"Never Seen"], [u"In Progress"]),
+    shared=([u"Selected", u"To Do", u"Created"], [u"Blocked"], [u"Done", u"Accepted"]),
+)
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.analyzers import MultiContextAnalyzer
+    return MultiContextAnalyzer
+
+
+@pytest.mark.parametrize("strategy", [None, "oldest", "newest"])
+def test_matches_date_analyzers(klass, random_tickets, summary, strategy):
+    """Each context gives the same analyzed and ignored tickets as its own DateAnalyzer."""
+    from agile_analytics.analyzers import DateAnalyzer
+
+    results = klass(CONTEXTS).analyze(random_tickets, strategy=strategy)
+
+    assert sorted(results) == sorted(CONTEXTS)
+    for name, states in CONTEXTS.items():
+        expected = DateAnalyzer(*states).analyze(random_tickets, strategy=strategy)
+        assert len(expected[0]) > 0 and len(expected[1]) > 0
+        assert summary(*results[name]) == summary(*expected)
+
+
+def test_ignored_state_list(klass, Ticket, days_ago):
+    """Ignored tickets name the phase and the context's own list of states."""
+    t = Ticket(key="TEST-1", flow_logs=[dict(entered_at=days_ago(3), state="Created")])
+    results = klass(CONTEXTS).analyze([t])
+
+    analyzed, ignored = results['analysis']
+    assert analyzed == []
+    assert ignored[0]['ticket'] is t
+    assert ignored[0]['phase'] == "started"
+    assert ignored[0]['state_list'] is CONTEXTS['analysis'][1]
+
+
+def test_empty(klass):
+    """Nothing to analyze gives an empty result for every context."""
+    assert klass(CONTEXTS).analyze([]) == {name: ([], []) for name in CONTEXTS}
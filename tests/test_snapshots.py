@@ -0,0 +1,89 @@
+"""Test saving and loading ticket snapshots."""
+
+import pytest
+
+
+@pytest.fixture
+def tickets(Ticket, days_ago, datetime):
+    """Return tickets covering aware, naive and missing datetimes."""
+    from dateutil.tz import tzoffset
+
+    first = Ticket(
+        key="TEST-1",
+        title="First",
+        type="Story",
+        created_at=days_ago(30),
+        updated_at=days_ago(1),
+        flow_logs=[
+            dict(entered_at=days_ago(30), state="Created"),
+            dict(entered_at=days_ago(20), state="In Progress"),
+            dict(entered_at=days_ago(1), state="Done"),
+        ],
+    )
+    first.matched_filters = [1234, "project = FOO"]
+    second = Ticket(
+        key="TEST-2",
+        title=u"Second ☃",
+        type="Bug",
+        created_at=datetime(2016, 5, 1, 9, 30, tzinfo=tzoffset(None, -18000)),
+        flow_logs=[
+            dict(entered_at=datetime(2016, 5, 1, 9, 30, 0, 123456), state="Created"),
+        ],
+    )
+    third = Ticket(key="TEST-3", flow_logs=[])
+    return [first, second, third]
+
+
+def summary(ticket):
+    """Return everything a snapshot should preserve about a ticket."""
+    return (
+        ticket.key, ticket.title, ticket.type, ticket.created_at, ticket.updated_at,
+        [(e['state'], e['entered_at'], e['entered_at'].utcoffset()) for e in ticket.flow_log],
+        ticket.matched_filters,
+    )
+
+
+@pytest.mark.parametrize("verify", [True, False])
+def test_round_trip(tickets, tmpdir, verify):
+    """Tickets load back exactly as they were dumped."""
+    from agile_analytics.snapshots import dump_tickets, load_tickets
+
+    filename = str(tmpdir.join("tickets.snapshot"))
+    assert dump_tickets(tickets, filename) == 3
+    loaded = load_tickets(filename, verify=verify)
+    assert [summary(t) for t in loaded] == [summary(t) for t in tickets]
+    assert loaded[1].created_at.utcoffset() == tickets[1].created_at.utcoffset()
+
+
+def test_empty(tmpdir):
+    """An empty fetch round trips too."""
+    from agile_analytics.snapshots import dump_tickets, load_tickets
+
+    filename = str(tmpdir.join("tickets.snapshot"))
+    dump_tickets([], filename)
+    assert load_tickets(filename) == []
+
+
+def test_not_a_snapshot(tmpdir):
+    """Files that aren't snapshots are refused."""
+    from agile_analytics.snapshots import load_tickets
+
+    filename = tmpdir.join("tickets.pickle")
+    filename.write_binary(b"not a snapshot")
+    with pytest.raises(ValueError):
+        load_tickets(str(filename))
+
+
+def test_checksum(tickets, tmpdir):
+    """Snapshots whose contents don't match their checksum are refused."""
+    import zlib
+    from agile_analytics.snapshots import HEADER, dump_tickets, load_tickets
+
+    filename = tmpdir.join("tickets.snapshot")
+    dump_tickets(tickets, str(filename))
+    data = filename.read_binary()
+    payload = bytearray(zlib.decompress(data[HEADER.size:]))
+    payload[-1] ^= 0xff
+    filename.write_binary(data[:HEADER.size] + zlib.compress(bytes(payload)))
+    with pytest.raises(ValueError):
+        load_tickets(str(filename))
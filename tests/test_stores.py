@@ -0,0 +1,130 @@
+"""Test the bundled ticket stores."""
+
+import pytest
+
+
+@pytest.fixture(params=["ShelveTicketStore", "TicketStore"])
+def klass(request):
+    """Return the Class Under Test."""
+    from agile_analytics import stores
+    return getattr(stores, request.param)
+
+
+@pytest.fixture
+def store(klass, tmpdir):
+    """Return an instance of the CUT backed by a temporary file."""
+    s = klass(str(tmpdir.join("tickets")))
+    yield s
+    s.close()
+
+
+@pytest.fixture
+def make_ticket(Ticket, days_ago):
+    """Make a ticket updated some days ago."""
+    def _make_ticket(key, updated, title=""):
+        return Ticket(
+            key=key,
+            title=title,
+            created_at=days_ago(30),
+            updated_at=days_ago(updated),
+            flow_logs=[dict(entered_at=days_ago(30), state="Created")],
+        )
+    return _make_ticket
+
+
+def test_empty_watermark(store):
+    """An empty store has no watermark."""
+    assert store.watermark is None
+    assert len(store) == 0
+
+
+def test_merge(store, make_ticket, days_ago):
+    """Merged tickets are stored by key and advance the watermark."""
+    merged = store.merge([make_ticket("TEST-1", 5), make_ticket("TEST-2", 3)])
+    assert merged == 2
+    assert store.watermark == days_ago(3)
+    assert sorted(t.key for t in store.tickets()) == ["TEST-1", "TEST-2"]
+    assert store.get("TEST-1").flow_log[0]['state'] == "Created"
+
+
+def test_merge_replaces_older(store, make_ticket):
+    """Newer versions of a ticket replace older ones, but not vice versa."""
+    store.merge([make_ticket("TEST-1", 5, title="Old")])
+    store.merge([make_ticket("TEST-1", 1, title="New")])
+    assert store.get("TEST-1").title == "New"
+    assert store.merge([make_ticket("TEST-1", 3, title="Stale")]) == 0
+    assert store.get("TEST-1").title == "New"
+    assert len(store) == 1
+
+
+def test_merge_duplicate_keys(store, make_ticket, days_ago):
+    """A batch holding a key more than once stores its newest version."""
+    assert store.merge([make_ticket("TEST-1", 2, title="Older"), make_ticket("TEST-1", 1, title="Newer"), make_ticket("TEST-1", 3, title="Oldest")]) == 1
+    assert store.get("TEST-1").title == "Newer"
+    assert store.watermark == days_ago(1)
+    assert len(store) == 1
+
+    store.put_many([make_ticket("TEST-2", 1, title="Newer"), make_ticket("TEST-2", 2, title="Older")])
+    assert store.get("TEST-2").title == "Newer"
+
+
+def test_persisted(klass, tmpdir, make_ticket, days_ago):
+    """Tickets and the watermark survive reopening the store."""
+    filename = str(tmpdir.join("tickets"))
+    with klass(filename) as s:
+        s.merge([make_ticket("TEST-1", 2)])
+    with klass(filename) as s:
+        assert s.get("TEST-1").key == "TEST-1"
+        assert s.watermark == days_ago(2)
+
+
+@pytest.fixture
+def sqlite_store(tmpdir):
+    """Return a SQLite backed store."""
+    from agile_analytics.stores import TicketStore
+    s = TicketStore(str(tmpdir.join("tickets.db")))
+    yield s
+    s.close()
+
+
+def test_sqlite_round_trip(sqlite_store, Ticket, datetime, tzutc):
+    """Tickets come back with identical fields and flow logs."""
+    from dateutil.tz import tzoffset
+    eastern = tzoffset(None, -5 * 3600)
+    t = Ticket(
+        key="TEST-1",
+        title="Round trip",
+        created_at=datetime(2016, 3, 30, 17, 27, 9, 123456),
+        updated_at=datetime(2016, 5, 18, 16, 17, 21, tzinfo=tzutc),
+        flow_logs=[
+            dict(entered_at=datetime(2016, 3, 30, 17, 27, 9, tzinfo=eastern), state="Created"),
+            dict(entered_at=datetime(2016, 4, 1, 9, 0, 0, 123456, tzinfo=eastern), state="In Progress"),
+        ]
+    )
+    t.matched_filters = [9999, "project = FOO"]
+    sqlite_store.put(t)
+    loaded = sqlite_store.get("TEST-1")
+    assert (loaded.key, loaded.title, loaded.type) == ("TEST-1", "Round trip", "Story")
+    assert loaded.matched_filters == [9999, "project = FOO"]
+    assert loaded.created_at == t.created_at
+    assert loaded.created_at.tzinfo is None
+    assert loaded.updated_at == t.updated_at
+    assert list(loaded.flow_log) == list(t.flow_log)
+    assert loaded.flow_log[1]['entered_at'].utcoffset() == eastern.utcoffset(None)
+
+
+def test_sqlite_lookups(sqlite_store, Ticket, days_ago):
+    """Tickets can be found by update time and current state."""
+    sqlite_store.put_many([
+        Ticket(key="TEST-1", updated_at=days_ago(5), flow_logs=[
+            dict(entered_at=days_ago(9), state="Created"),
+            dict(entered_at=days_ago(5), state="Done"),
+        ]),
+        Ticket(key="TEST-2", updated_at=days_ago(1), flow_logs=[
+            dict(entered_at=days_ago(9), state="Created"),
+        ]),
+    ])
+    assert [t.key for t in sqlite_store.updated_since(days_ago(3))] == ["TEST-2"]
+    assert [t.key for t in sqlite_store.in_state("Done")] == ["TEST-1"]
+    assert [len(t.flow_log) for t in sqlite_store.tickets()] == [2, 1]
+    assert sqlite_store.get("TEST-3") is None
@@ -0,0 +1,68 @@
+"""Test interning state and type names."""
+
+import pytest
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.symbols import SymbolTable
+    return SymbolTable
+
+
+def test_codes(klass):
+    """Names get codes in order of first appearance and keep them."""
+    table = klass()
+    assert table.code("Open") == 0
+    assert table.code("Done") == 1
+    assert table.code("Open") == 0
+    assert table.name(1) == "Done"
+    assert len(table) == 2
+    assert "Done" in table
+
+
+def test_find(klass):
+    """Finding a name doesn't add it."""
+    table = klass()
+    assert table.find("Open") is None
+    assert "Open" not in table
+    table.code("Open")
+    assert table.find("Open") == 0
+
+
+def test_intern(klass):
+    """Equal names share one copy."""
+    table = klass()
+    first = "".join(["In ", "Progress"])
+    second = "".join(["In Pro", "gress"])
+    assert first is not second
+    assert table.intern(first) is table.intern(second)
+
+
+def test_threads(klass):
+    """Names added from several threads at once still get one code each."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    table = klass()
+    names = ["State {}".format(n % 50) for n in range(5000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = list(pool.map(table.code, names))
+    assert len(table) == 50
+    assert all(table.name(code) == name for code, name in zip(codes, names))
+
+
+def test_flow_entries_share_states(datetime):
+    """Flow entries and tickets intern their states and types at ingest."""
+    from agile_analytics.models import AgileTicket, FlowEntry
+    from agile_analytics.symbols import STATES, TICKET_TYPES
+
+    first = FlowEntry(datetime.now(), "".join(["In ", "QA"]))
+    second = FlowEntry(datetime.now(), "".join(["In Q", "A"]))
+    assert first.state is second.state
+    assert first.state_code == second.state_code == STATES.find("In QA")
+
+    t = AgileTicket("TEST-1", ttype="".join(["Spi", "ke"]))
+    assert t.type is TICKET_TYPES.intern("Spike")
+    assert t.type_code == TICKET_TYPES.find("Spike")
+    assert t.__getstate__()['type'] == "Spike"
+    assert 'type_code' not in t.__getstate__()
@@ -0,0 +1,122 @@
+"""Test the rate limit handling."""
+
+import pytest
+
+from pretend import stub
+
+
+class Throttled(Exception):
+    """A stand in for a request exception carrying an HTTP response."""
+
+    def __init__(self, status_code=429, headers=None):
+        super(Throttled, self).__init__(status_code)
+        self.status_code = status_code
+        self.response = stub(status_code=status_code, headers=headers or {})
+
+
+@pytest.fixture
+def klass():
+    """Return the Class Under Test."""
+    from agile_analytics.throttling import RateController
+    return RateController
+
+
+@pytest.fixture
+def sleeps():
+    """Record the waits instead of sleeping through them."""
+    return []
+
+
+@pytest.fixture
+def controller(klass, sleeps):
+    """Return an instance of the CUT that doesn't really sleep."""
+    return klass(max_concurrency=8, max_retries=3, backoff=1.0, sleep=sleeps.append, jitter=lambda: 0.5)
+
+
+@pytest.fixture
+def flaky():
+    """Make a function that fails with the given exceptions before succeeding."""
+    def _flaky(*failures):
+        failures = list(failures)
+
+        def _call():
+            if failures:
+                raise failures.pop(0)
+            return "ok"
+        return _call
+    return _flaky
+
+
+def test_retry_after(controller, flaky, sleeps):
+    """Throttled calls wait as long as the server asks, then succeed."""
+    assert controller.call(flaky(Throttled(429, {'Retry-After': '3'}), Throttled(503, {'Retry-After': '1'}))) == "ok"
+    assert sleeps == [3.0, 1.0]
+    assert controller.retries == 2
+    assert controller.requests == 3
+    assert controller.throttled_seconds == 4.0
+
+
+def test_retry_after_date(controller, flaky, sleeps):
+    """Retry-After given as an HTTP date in the past means retry right away."""
+    controller.call(flaky(Throttled(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})))
+    assert sleeps == [0.0]
+
+
+def test_jittered_backoff(controller, flaky, sleeps):
+    """Without Retry-After the backoff doubles each time and is jittered."""
+    controller.call(flaky(Throttled(), Throttled(), Throttled()))
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+def test_max_backoff(klass, sleeps):
+    """Backoffs never exceed max_backoff."""
+    controller = klass(backoff=1.0, max_backoff=5.0, sleep=sleeps.append, jitter=lambda: 1.0)
+    assert controller.delay(10) == 5.0
+
+
+def test_gives_up(controller, flaky):
+    """Once retries are used up the throttle is raised."""
+    with pytest.raises(Throttled):
+        controller.call(flaky(*[Throttled() for _ in range(4)]))
+    assert controller.retries == 3
+
+
+def test_other_errors_raise(controller, flaky, sleeps):
+    """Errors that aren't throttles aren't retried."""
+    with pytest.raises(Throttled):
+        controller.call(flaky(Throttled(404)))
+    assert sleeps == []
+
+
+def test_aimd(controller, flaky):
+    """Throttles halve the concurrency and successes slowly grow it back."""
+    assert controller.concurrency == 8
+    controller.call(flaky(Throttled(), Throttled()))
+    assert controller.concurrency == 2
+    for _ in range(10):
+        controller.call(flaky())
+    assert 2 < controller.concurrency < 8
+    for _ in range(100):
+        controller.call(flaky())
+    assert controller.concurrency == 8
+
+
+def test_call_async(controller, flaky):
+    """Coroutines are retried the same way, waiting on the event loop."""
+    import asyncio
+
+    call = flaky(Throttled(429, {'Retry-After': '0'}), Throttled(503))
+    controller.backoff = 0.0
+
+    async def _call():
+        return call()
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(controller.call_async(_call)) == "ok"
+        with pytest.raises(Throttled):
+            loop.run_until_complete(controller.call_async(flaky(Throttled(404))))
+    finally:
+        loop.close()
+    assert (controller.requests, controller.retries) == (4, 2)
+    assert controller.concurrency == 2